@@ -0,0 +1,52 @@
+# ========== Gunicorn Configuration ==========
+# Production server settings for the AI Study Material Generator.
+#
+# Start the app with:
+#   gunicorn -c gunicorn_conf.py "src.api.app:create_app()"
+#
+# run.py is only meant for local development.
+
+import multiprocessing
+import os
+
+# ========== Server Socket ==========
+# Address and port the server listens on
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# ========== Worker Processes ==========
+# Three settings decide how much CPU work can run at the same time:
+# - GUNICORN_WORKERS: worker processes (below)
+# - PROCESSING_WORKERS: background upload jobs per worker process
+# - PDF_PARSE_WORKERS: PDF text extraction processes per worker process
+# Uploads are CPU-bound (parsing, NLP, transcription), so the usual
+# "2 x CPU cores + 1" for I/O-bound workers would oversubscribe the CPU
+# many times over. Instead there is one worker per core, and the
+# per-worker pools default to an even share of the cores, so together
+# they use about one core each. Setting any of the variables overrides
+# its default.
+cpu_count = multiprocessing.cpu_count()
+
+# Number of worker processes (one per CPU core)
+workers = int(os.getenv('GUNICORN_WORKERS', cpu_count))
+
+# Each worker's share of the cores for its upload jobs and PDF processes.
+# Config reads these when the app is loaded, which happens after this file
+cores_per_worker = str(max(1, cpu_count // workers))
+os.environ.setdefault('PROCESSING_WORKERS', cores_per_worker)
+os.environ.setdefault('PDF_PARSE_WORKERS', cores_per_worker)
+# Threaded workers overlap blocking work (SQLite, disk reads, file downloads)
+worker_class = 'gthread'
+# Threads per worker process
+threads = int(os.getenv('GUNICORN_THREADS', 5))
+
+# Load the app once before forking so workers share the already
+# initialized processors and templates (copy-on-write memory)
+preload_app = True
+
+# Seconds a worker may stay silent before it is restarted
+timeout = 120
+
+# ========== Logging ==========
+# Send access and error logs to stdout/stderr
+accesslog = '-'
+errorlog = '-'
@@ -6,6 +6,7 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.api.app import create_app
+from src.utils.config import Config
 
 if __name__ == '__main__':
     app = create_app()
@@ -36,7 +37,9 @@ if __name__ == '__main__':
     print("="*60 + "\n")
     
     try:
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        # Flask's development server - use gunicorn_conf.py in production.
+        # Debug mode is only enabled when FLASK_ENV is 'development'.
+        app.run(debug=Config.FLASK_ENV == 'development', host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         print("\n\n" + "="*60)
         print(" Server stopped. Thank you for using!")
@@ -1,8 +1,18 @@
 # ========== Imports ==========
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 import sys
 
+# orjson is optional - it turns Python objects into JSON much faster
+# than the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ========== Path Setup ==========
 # Add project root to Python path for easy imports
 project_root = Path(__file__).parent.parent.parent
@@ -11,14 +21,43 @@ sys.path.insert(0, str(project_root))
 # ========== Config & Database ==========
 from src.utils.config import Config
 from src.storage.database import Database
+from src.core.file_parser import FileParser
+from src.core.text_processor import TextProcessor
+from src.core.flashcard_generator import FlashcardGenerator
+from src.core.summary_generator import SummaryGenerator
+from src.core.concept_mapper import ConceptMapper
+from src.core.learning_path import LearningPathGenerator
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson for jsonify() and request.get_json().
+
+    Keeps Flask's sorted keys and falls back to Flask's default handling
+    for types orjson doesn't know about.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 def create_app():
     """
     Create and configure the Flask application.
 
     - Sets up Flask app with template and static folders.
+    - Uses orjson for JSON responses when it is installed.
     - Loads configuration and sets secret key, upload folder, and max file size.
-    - Initializes required folders and the database.
+    - Initializes required folders and the database, and marks uploads
+      interrupted by a previous shutdown as failed.
+    - Builds the study material processors once so every request reuses them.
+    - Starts the background executor that processes uploads.
     - Registers all routes for the app.
     - Returns the configured Flask app instance.
     """
@@ -28,6 +67,10 @@ def create_app():
         static_folder=str(project_root / 'static')
     )
 
+    # Use the faster orjson serializer for JSON responses when installed
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
     # Set secret key and upload settings
     app.config['SECRET_KEY'] = Config.SECRET_KEY
     app.config['UPLOAD_FOLDER'] = str(Config.UPLOAD_FOLDER)
@@ -40,12 +83,46 @@ def create_app():
     db = Database(Config.DATABASE_PATH)
     app.config['DATABASE'] = db
 
+    # Jobs from a previous run died with that process, so their materials
+    # would stay 'processing' forever. This runs once per server start
+    # (gunicorn loads the app once in the master process, see preload_app)
+    interrupted = db.fail_interrupted_materials()
+    if interrupted:
+        print(f"⚠ Marked {interrupted} interrupted material(s) as failed")
+
+    # Build all processors once (NLTK data, stopwords, etc. load only here)
+    # instead of on every upload request
+    app.config['PROCESSORS'] = create_processors()
+
+    # Uploads are processed in the background so requests return right away
+    app.config['EXECUTOR'] = ThreadPoolExecutor(max_workers=Config.PROCESSING_WORKERS)
+
     # Register all Flask routes (views, APIs, etc.)
     from src.api.routes import register_routes
     register_routes(app)
 
     return app
 
+def create_processors():
+    """
+    Create one instance of every study material processor.
+
+    Returns:
+        SimpleNamespace: parser, text_processor, flashcard_gen, summary_gen,
+                         concept_mapper and learning_path_gen instances
+    """
+    return SimpleNamespace(
+        parser=FileParser(
+            pdf_workers=Config.PDF_PARSE_WORKERS,
+            parallel_min_pages=Config.PDF_PARALLEL_MIN_PAGES
+        ),
+        text_processor=TextProcessor(),
+        flashcard_gen=FlashcardGenerator(),
+        summary_gen=SummaryGenerator(),
+        concept_mapper=ConceptMapper(),
+        learning_path_gen=LearningPathGenerator()
+    )
+
 # ========== Main Entry Point ==========
 if __name__ == '__main__':
     # Start the Flask development server
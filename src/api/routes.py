@@ -1,17 +1,14 @@
 # ========== Imports ==========
 from flask import render_template, request, jsonify, send_file, redirect, url_for
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from src.utils.config import Config
 from src.utils.helpers import Helpers
-from src.core.file_parser import FileParser
-from src.core.text_processor import TextProcessor
-from src.core.flashcard_generator import FlashcardGenerator
-from src.core.summary_generator import SummaryGenerator
-from src.core.concept_mapper import ConceptMapper
-from src.core.learning_path import LearningPathGenerator
 from src.storage.file_manager import FileManager
 
 # ========== Route Registration ==========
@@ -23,10 +20,70 @@ def register_routes(app):
     This function sets up all the web pages and API endpoints
     that the app will respond to.
     """
-    # Get database and file manager ready
+    # Get database, file manager and the shared processors ready
     db = app.config['DATABASE']
+    procs = app.config['PROCESSORS']
+    executor = app.config['EXECUTOR']
     file_manager = FileManager(Config.OUTPUT_FOLDER)
 
+    # Background processing jobs still running in this process (material_id -> Future)
+    jobs = {}
+    # Current pipeline stage of each running job (material_id -> stage name)
+    job_stages = {}
+    # Outcome of recently finished jobs for /status (material_id -> (stats, error)).
+    # Only the newest FINISHED_JOBS_LIMIT are kept, so results nobody asks
+    # for (the client left, or polled another worker) don't pile up
+    finished_jobs = OrderedDict()
+    finished_jobs_lock = threading.Lock()
+    FINISHED_JOBS_LIMIT = 256
+
+    def on_job_done(material_id, future):
+        """
+        Stop tracking a finished job and keep its outcome for /status.
+
+        Args:
+            material_id (int): Material the job processed
+            future (Future): The finished job
+        """
+        jobs.pop(material_id, None)
+        job_stages.pop(material_id, None)
+
+        error = future.exception()
+        outcome = (None, str(error)) if error else (future.result(), None)
+
+        with finished_jobs_lock:
+            finished_jobs[material_id] = outcome
+            while len(finished_jobs) > FINISHED_JOBS_LIMIT:
+                finished_jobs.popitem(last=False)  # Drop the oldest
+
+    # Cached API payloads (key -> (database change token, payload))
+    api_cache = {}
+
+    def cached_payload(key, build):
+        """
+        Return a cached payload, rebuilding it only after the database changed.
+
+        Args:
+            key (str): Name of the cached payload
+            build (callable): Function that computes the payload
+
+        Returns:
+            Cached or freshly built payload
+        """
+        # Read the token before building, so a write that happens while
+        # building makes the next request rebuild again
+        token = db.get_change_token()
+        cached = api_cache.get(key)
+        if cached and cached[0] == token:
+            return cached[1]
+
+        payload = build()
+        # Every page is its own entry, so keep the cache from growing forever
+        if len(api_cache) >= 64:
+            api_cache.clear()
+        api_cache[key] = (token, payload)
+        return payload
+
     @app.route('/')
     def index():
         """Show the home page with file upload form."""
@@ -34,9 +91,19 @@ def register_routes(app):
 
     @app.route('/dashboard')
     def dashboard():
-        """Show dashboard with all uploaded study materials."""
-        materials = db.get_all_materials()
-        return render_template('dashboard.html', materials=materials)
+        """Show dashboard with uploaded study materials, one page at a time."""
+        limit = Config.MATERIALS_PAGE_SIZE
+        offset = max(0, request.args.get('offset', 0, type=int))
+
+        # Ask for one extra row to know if there is another page
+        materials = db.get_materials_page(limit + 1, offset)
+        next_offset = offset + limit if len(materials) > limit else None
+        prev_offset = max(0, offset - limit) if offset > 0 else None
+
+        return render_template('dashboard.html',
+                            materials=materials[:limit],
+                            next_offset=next_offset,
+                            prev_offset=prev_offset)
 
     @app.route('/upload', methods=['POST'])
     def upload_file():
@@ -48,7 +115,7 @@ def register_routes(app):
         - Validate file type
         - Save the file to uploads folder
         - Save file info to database
-        - Process the file to generate study materials
+        - Start processing the file in the background
         """
         try:
             # Check if file is present in the request
@@ -62,37 +129,167 @@ def register_routes(app):
                 return jsonify({'error': 'No file selected'}), 400
 
             # Check if file type is allowed
-            if not Helpers.allowed_file(file.filename, Config.ALLOWED_EXTENSIONS):
+            if not Helpers.allowed_file(file.filename, Config.ALLOWED_SUFFIXES):
                 return jsonify({'error': 'Invalid file type. Allowed: PDF, TXT, DOCX'}), 400
 
             # Save the file with a unique name
             filename = Helpers.secure_filename_with_timestamp(file.filename)
             filepath = Config.UPLOAD_FOLDER / filename
-            file.save(str(filepath))
+            try:
+                file.save(str(filepath))
+            except BaseException:
+                # Don't leave a half-saved file behind
+                remove_partial_upload(filepath)
+                raise
+
+            return finish_upload(filepath, filename)
+
+        except HTTPException:
+            # Let Flask answer with the right status (e.g. 413 when the
+            # upload is larger than MAX_CONTENT_LENGTH)
+            raise
+        except Exception as e:
+            # If any error occurs, return error message
+            return jsonify({'error': str(e)}), 500
+
+    @app.route('/upload-stream', methods=['POST'])
+    def upload_file_stream():
+        """
+        Handle a raw file upload without multipart form parsing.
 
-            # Get file size and type
-            file_size = filepath.stat().st_size
-            file_type = Helpers.get_file_extension(filename)
+        The request body is the file itself and the original filename is
+        sent in the X-Filename header. The body is copied to disk in
+        fixed-size chunks, so large files never sit in memory.
+        """
+        try:
+            # Original filename comes from the header instead of a form field
+            original_name = request.headers.get('X-Filename', '')
 
-            # Save file info to database
-            material_id = db.save_material(filename, file_type, file_size)
+            if original_name == '':
+                return jsonify({'error': 'No file selected'}), 400
 
-            # Process the uploaded file to generate study materials
-            process_result = process_uploaded_file(filepath, material_id, db, file_manager)
+            # Check if file type is allowed
+            if not Helpers.allowed_file(original_name, Config.ALLOWED_SUFFIXES):
+                return jsonify({'error': 'Invalid file type. Allowed: PDF, TXT, DOCX'}), 400
 
-            # Return success response with stats
-            return jsonify({
-                'success': True,
-                'material_id': material_id,
-                'filename': filename,
-                'message': 'File processed successfully',
-                'stats': process_result
-            })
+            filename = Helpers.secure_filename_with_timestamp(original_name)
+            filepath = Config.UPLOAD_FOLDER / filename
 
+            # Copy the request body to disk one chunk at a time
+            try:
+                with open(filepath, 'wb') as f:
+                    while True:
+                        chunk = request.stream.read(Config.UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+            except BaseException:
+                # The body was too large or the client disconnected, so
+                # don't leave the partial file behind
+                remove_partial_upload(filepath)
+                raise
+
+            return finish_upload(filepath, filename)
+
+        except HTTPException:
+            # Let Flask answer with the right status (e.g. 413 when the
+            # body is larger than MAX_CONTENT_LENGTH)
+            raise
         except Exception as e:
-            # If any error occurs, return error message
             return jsonify({'error': str(e)}), 500
 
+    def remove_partial_upload(filepath):
+        """
+        Delete an upload that could not be saved completely.
+
+        Args:
+            filepath (Path): Where the upload was being saved
+        """
+        try:
+            filepath.unlink()
+        except OSError:
+            pass  # Nothing was written, or it is already gone
+
+    def finish_upload(filepath, filename):
+        """
+        Save an uploaded file's info to the database and queue it for processing.
+
+        Shared by both upload routes once the file is on disk. Processing
+        runs in the background; clients poll /status/<material_id> for the result.
+
+        Args:
+            filepath (Path): Where the uploaded file was saved
+            filename (str): Secure filename used on disk
+
+        Returns:
+            tuple: JSON response and 202 Accepted status code
+        """
+        # Get file size and type
+        file_size = filepath.stat().st_size
+        file_type = Helpers.get_file_extension(filename)
+
+        # Save file info to database (marked as processing until the job ends)
+        material_id = db.save_material(filename, file_type, file_size, status='processing')
+
+        # Process the uploaded file in the background, recording each stage
+        # it reaches so /status can report progress
+        def on_stage(stage):
+            job_stages[material_id] = stage
+
+        job = executor.submit(
+            run_processing_job, filepath, material_id, db, file_manager, procs, on_stage
+        )
+        jobs[material_id] = job
+        # Clean up as soon as the job ends, whether or not anyone polls /status
+        job.add_done_callback(lambda future: on_job_done(material_id, future))
+
+        # Tell the client the file was accepted and is being processed
+        return jsonify({
+            'success': True,
+            'material_id': material_id,
+            'filename': filename,
+            'status': 'processing',
+            'message': 'File uploaded, processing started'
+        }), 202
+
+    @app.route('/status/<int:material_id>')
+    def processing_status(material_id):
+        """
+        Get the processing status of an uploaded material.
+
+        Returns 'processing', 'processed' or 'failed'. While processing, the
+        current pipeline 'stage' is included; the generated stats (or the
+        error message) are included once the background job ends, if it
+        ran in this process and finished recently.
+        """
+        material = db.get_material_by_id(material_id)
+
+        if not material:
+            return jsonify({'error': 'Material not found'}), 404
+
+        response = {'material_id': material_id, 'status': material['status']}
+
+        # Report the stage while the job is still running in this process
+        job = jobs.get(material_id)
+        if job is not None and not job.done():
+            response['status'] = 'processing'
+            response['stage'] = job_stages.get(material_id, 'queued')
+            return jsonify(response)
+
+        # Add the stats (or the error) if this process ran the job recently
+        with finished_jobs_lock:
+            outcome = finished_jobs.get(material_id)
+        if outcome is not None:
+            stats, error = outcome
+            if error:
+                response['status'] = 'failed'
+                response['error'] = error
+            else:
+                response['status'] = 'processed'
+                response['stats'] = stats
+
+        return jsonify(response)
+
     @app.route('/material/<int:material_id>')
     def view_material(material_id):
         """
@@ -145,31 +342,41 @@ def register_routes(app):
     def view_concept_map(material_id):
         """
         Show concept map for a specific material.
-        Always generates a graph, even with minimal data.
+        Uses the concept map saved during processing, and generates one
+        on demand if it isn't there (so there is always a graph to show).
         """
         material = db.get_material_by_id(material_id)
+        if not material:
+            return "Material not found", 404
+
         topics = db.get_topics_by_material(material_id)
-        
-        print(f"\n=== Concept Map Debug ===")
-        print(f"Material: {material['filename']}")
-        print(f"Topics found: {len(topics)}")
-        
-        # Always generate a concept graph
-        concept_mapper = ConceptMapper()
-        
-        # Get topics or create fallback
-        topic_names = [t['topic_name'] for t in topics] if topics else ["Main Topic", "Key Concept"]
-        
-        print(f"Using topics: {topic_names[:5]}")
-        
-        # Generate graph
-        graph_data = concept_mapper.create_concept_graph(topic_names, "Sample text content for relationships")
-        
-        concept_graph = {
-            'graph': graph_data,
-            'generated_at': 'on_demand'
-        }
-        
+
+        # Load the saved concept map (parsed files are cached until they change)
+        filename = Path(material['filename']).stem
+        saved_path = Config.CONCEPT_MAPS_FOLDER / f"{filename}_concept_map.json"
+        try:
+            concept_graph = file_manager.load_json_cached(saved_path)
+        except (OSError, ValueError):
+            concept_graph = None
+
+        if concept_graph is None:
+            print(f"\n=== Concept Map Debug ===")
+            print(f"Material: {material['filename']}")
+            print(f"Topics found: {len(topics)}")
+
+            # Get topics or create fallback
+            topic_names = [t['topic_name'] for t in topics] if topics else ["Main Topic", "Key Concept"]
+
+            print(f"Using topics: {topic_names[:5]}")
+
+            # Generate graph
+            graph_data = procs.concept_mapper.create_concept_graph(topic_names, "Sample text content for relationships")
+
+            concept_graph = {
+                'graph': graph_data,
+                'generated_at': 'on_demand'
+            }
+
         return render_template('concept_map.html',
                             material=material,
                             concept_graph=concept_graph,
@@ -185,7 +392,8 @@ def register_routes(app):
         if not material:
             return "Material not found", 404
 
-        filename = material['filename']
+        # Output files are named after the upload without its extension
+        filename = Path(material['filename']).stem
         file_map = {
             'flashcards_json': Config.FLASHCARDS_FOLDER / f"{filename}.json",
             'flashcards_csv': Config.FLASHCARDS_FOLDER / f"{filename}.csv",
@@ -197,7 +405,10 @@ def register_routes(app):
         filepath = file_map.get(file_type)
 
         if filepath and filepath.exists():
-            return send_file(str(filepath), as_attachment=True)
+            # conditional/etag let browsers revalidate with If-None-Match or
+            # If-Modified-Since and get a 304 without the file being re-sent
+            # (the ETag comes from the file's mtime and size)
+            return send_file(str(filepath), as_attachment=True, conditional=True, etag=True)
 
         return "File not found", 404
 
@@ -239,28 +450,66 @@ def register_routes(app):
         API endpoint to get overall statistics.
         Returns total materials, flashcards, and summaries.
         """
-        materials = db.get_all_materials()
+        def build_stats():
+            # One aggregate query instead of summing every material row
+            totals = db.get_stats_totals()
 
-        total_flashcards = sum(m['flashcard_count'] for m in materials)
-        total_summaries = sum(m['summary_count'] for m in materials)
+            return {
+                'total_materials': totals[0],
+                'total_flashcards': totals[1],
+                'total_summaries': totals[2]
+            }
 
-        return jsonify({
-            'total_materials': len(materials),
-            'total_flashcards': total_flashcards,
-            'total_summaries': total_summaries
-        })
+        return jsonify(cached_payload('stats', build_stats))
 
     @app.route('/api/materials')
     def get_materials_api():
         """
-        API endpoint to get all materials as JSON.
+        API endpoint to get materials as JSON, one page at a time.
+
+        Query parameters:
+            limit: Number of materials per page (default Config.MATERIALS_PAGE_SIZE)
+            offset: Number of materials to skip (default 0)
+
+        Returns:
+            JSON with 'items' and 'next_offset' (None on the last page)
         """
-        materials = db.get_all_materials()
-        return jsonify(materials)
+        limit = request.args.get('limit', Config.MATERIALS_PAGE_SIZE, type=int)
+        limit = min(max(1, limit), Config.MATERIALS_MAX_PAGE_SIZE)
+        offset = max(0, request.args.get('offset', 0, type=int))
+
+        def build_page():
+            materials = db.get_materials_page(limit, offset)
+            return {
+                'items': materials,
+                'next_offset': offset + len(materials) if len(materials) == limit else None
+            }
+
+        return jsonify(cached_payload(f'materials:{limit}:{offset}', build_page))
 
 # ========== File Processing Logic ==========
 
-def process_uploaded_file(filepath, material_id, db, file_manager):
+def run_processing_job(filepath, material_id, db, file_manager, procs, on_stage=None):
+    """
+    Run process_uploaded_file as a background job.
+
+    Marks the material as 'processed' when the pipeline succeeds and as
+    'failed' when it raises, so the status survives after the job ends.
+
+    Returns:
+        dict: Statistics about the generated materials
+    """
+    try:
+        stats = process_uploaded_file(filepath, material_id, db, file_manager, procs, on_stage)
+    except Exception as e:
+        print(f" Processing failed for material {material_id}: {e}")
+        db.update_material_status(material_id, 'failed')
+        raise
+
+    db.update_material_status(material_id, 'processed')
+    return stats
+
+def process_uploaded_file(filepath, material_id, db, file_manager, procs, on_stage=None):
     """
     Process the uploaded file and generate all study materials.
 
@@ -272,26 +521,33 @@ def process_uploaded_file(filepath, material_id, db, file_manager):
     - Generate concept map and save it
     - Generate learning path and save it
 
+    Args:
+        on_stage (callable, optional): Called with the name of each step
+                                       ('parsing', 'topics', 'flashcards', ...)
+                                       as it starts
+
     Returns:
         dict: Statistics about the generated materials
     """
-    # Initialize all processors
-    parser = FileParser()
-    text_processor = TextProcessor()
-    flashcard_gen = FlashcardGenerator()
-    summary_gen = SummaryGenerator()
-    concept_mapper = ConceptMapper()
-    learning_path_gen = LearningPathGenerator()
+    def report(stage):
+        if on_stage is not None:
+            on_stage(stage)
 
     # Parse file to get text
-    text = parser.parse(filepath)
+    report('parsing')
+    text = procs.parser.parse(filepath)
+
+    # Split into sentences once and share them with every generator
+    sentences = procs.text_processor.segment(text)
 
     # Extract topics from text
-    topics = text_processor.extract_topics(text)
+    report('topics')
+    topics = procs.text_processor.extract_topics(text)
     db.save_topics(material_id, topics)
 
     # Generate flashcards
-    flashcards = flashcard_gen.generate(text, topics, num_cards=25)
+    report('flashcards')
+    flashcards = procs.flashcard_gen.generate(text, topics, num_cards=25, sentences=sentences)
     db.save_flashcards(material_id, flashcards)
 
     # Save flashcards to JSON and CSV files
@@ -300,16 +556,19 @@ def process_uploaded_file(filepath, material_id, db, file_manager):
     file_manager.save_flashcards_csv(flashcards, filename)
 
     # Generate summary and save
-    summary = summary_gen.generate(text, ratio=0.3)
+    report('summary')
+    summary = procs.summary_gen.generate(text, ratio=0.3, sentences=sentences)
     db.save_summary(material_id, summary)
     file_manager.save_summary_json(summary, filename)
 
     # Generate concept map and save
-    concept_graph = concept_mapper.create_concept_graph(topics, text)
+    report('concept_map')
+    concept_graph = procs.concept_mapper.create_concept_graph(topics, text)
     file_manager.save_concept_map_json(concept_graph, f"{filename}_concept_map")
 
     # Generate learning path and save
-    learning_path = learning_path_gen.generate(topics, flashcards)
+    report('learning_path')
+    learning_path = procs.learning_path_gen.generate(topics, flashcards)
     file_manager.save_learning_path_json(learning_path, f"{filename}_learning_path")
 
     # Return stats for UI
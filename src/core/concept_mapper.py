@@ -1,7 +1,3 @@
-# ========== Imports ==========
-from collections import defaultdict
-import re
-
 class ConceptMapper:
     """
     ConceptMapper creates interactive concept graphs showing topic relationships.
@@ -62,27 +58,29 @@ class ConceptMapper:
         Returns:
             list: List of node objects for D3.js
         """
-        nodes = []
-        
-        for i, topic in enumerate(topics):
-            # Clean topic name for display
-            topic_clean = str(topic).strip()[:30]  # Limit length
-            
-            # Determine node type and color
-            node_type = 'main' if i < 4 else 'sub'
-            node_color = '#4CAF50' if node_type == 'main' else '#2196F3'
-            
-            # Create node object
-            node = {
+        # The first 4 topics are main nodes, the rest are sub nodes
+        main_nodes = [
+            {
                 'id': f"node_{i}",
-                'label': topic_clean,
-                'type': node_type,
-                'color': node_color,
-                'size': 25 if node_type == 'main' else 18
+                'label': str(topic).strip()[:30],  # Clean and limit length
+                'type': 'main',
+                'color': '#4CAF50',
+                'size': 25
             }
-            nodes.append(node)
-        
-        return nodes
+            for i, topic in enumerate(topics[:4])
+        ]
+        sub_nodes = [
+            {
+                'id': f"node_{i}",
+                'label': str(topic).strip()[:30],
+                'type': 'sub',
+                'color': '#2196F3',
+                'size': 18
+            }
+            for i, topic in enumerate(topics[4:], start=4)
+        ]
+
+        return main_nodes + sub_nodes
 
     def _create_guaranteed_edges(self, topics, text):
         """
@@ -95,18 +93,20 @@ class ConceptMapper:
         Returns:
             list: List of edge objects for D3.js
         """
-        edges = []
-        
-        # Method 1: Create hub connections (first topic connects to others)
-        hub_edges = self._create_hub_connections(topics)
-        edges.extend(hub_edges)
-        
-        # Method 2: Create sequential connections
-        sequential_edges = self._create_sequential_edges(topics)
-        edges.extend(sequential_edges)
-        
+        n = len(topics)
+
+        # Method 1: Hub connections (first topic connects to the next few)
+        # Method 2: Sequential connections between neighbouring topics
+        edges = [
+            {'source': 'node_0', 'target': f'node_{i}', 'weight': 3, 'type': 'hub'}
+            for i in range(1, min(6, n))
+        ] + [
+            {'source': f'node_{i}', 'target': f'node_{i+1}', 'weight': 2, 'type': 'sequential'}
+            for i in range(min(6, n - 1))
+        ]
+
         # Method 3: Add some cross connections for richness
-        if len(topics) >= 4:
+        if n >= 4:
             # Connect nodes with interesting patterns
             edges.append({
                 'source': 'node_1',
@@ -115,7 +115,7 @@ class ConceptMapper:
                 'type': 'related'
             })
             
-        if len(topics) >= 6:
+        if n >= 6:
             edges.append({
                 'source': 'node_2',
                 'target': 'node_5',
@@ -124,34 +124,3 @@ class ConceptMapper:
             })
         
         return edges
-
-    def _create_hub_connections(self, topics):
-        """Create hub-style connections (first topic connects to others)."""
-        edges = []
-        
-        if len(topics) > 1:
-            # Connect first topic (main hub) to next topics
-            for i in range(1, min(6, len(topics))):
-                edges.append({
-                    'source': 'node_0',
-                    'target': f'node_{i}',
-                    'weight': 3,
-                    'type': 'hub'
-                })
-        
-        return edges
-
-    def _create_sequential_edges(self, topics):
-        """Create simple sequential connections between topics."""
-        edges = []
-        
-        for i in range(len(topics) - 1):
-            if i < 6:  # Limit connections
-                edges.append({
-                    'source': f"node_{i}",
-                    'target': f"node_{i+1}",
-                    'weight': 2,
-                    'type': 'sequential'
-                })
-        
-        return edges
\ No newline at end of file
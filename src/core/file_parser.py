@@ -1,8 +1,96 @@
 # ========== Imports ==========
-import PyPDF2
-import docx
+# PyPDF2 and python-docx are imported inside the methods that use them,
+# so uploads of other file types don't pay for loading them
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+import multiprocessing
+import os
 import re
+import threading
+
+# ========== Text Cleanup Patterns ==========
+# Compiled once here instead of on every call (they run for every PDF page)
+_PDF_NONTEXT_RE = re.compile(r'[^\w\s\.\,\?\!\:\;\-\(\)\[\]\/]')   # Unwanted characters and artifacts
+_BROKEN_WORD_RE = re.compile(r'\b([a-z])\s+([a-z])\s+([a-z])')          # Letters split by spaces
+_WS_RE = re.compile(r'\s+')                                            # Runs of whitespace
+_SINGLE_CHAR_RE = re.compile(r'\b[0-9]\b|\b[a-zA-Z]\b')                # Single characters and digits
+_NON_LETTER_RE = re.compile(r'[\W\d_]+')                                # Anything that is not a letter
+
+# Same cleanup as _PDF_NONTEXT_RE, as a str.translate() table for ASCII text
+# (a plain table lookup per character is much faster than the regex engine)
+_PDF_NONTEXT_ASCII_TABLE = str.maketrans({
+    code: ' ' for code in range(128) if _PDF_NONTEXT_RE.match(chr(code))
+})
+
+# Pages longer than this with fewer letters than the ratio below are treated
+# as scanned images / garbage encoding and skipped without cleaning
+PDF_DENSITY_MIN_CHARS = 200
+PDF_MIN_LETTER_RATIO = 0.3
+
+# ========== Parallel PDF Extraction ==========
+
+# Worker processes for large PDFs, started on first use and then reused
+# (starting Python processes takes much longer than reading a few pages)
+_pdf_pool = None
+_pdf_pool_pid = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool(workers):
+    """
+    Get the shared PDF worker pool, starting it if needed.
+
+    A new pool is started after a fork (e.g. in each gunicorn worker),
+    since worker processes belong to the process that started them.
+
+    Args:
+        workers (int): Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor: The shared pool
+    """
+    global _pdf_pool, _pdf_pool_pid
+
+    with _pdf_pool_lock:
+        if _pdf_pool is None or _pdf_pool_pid != os.getpid():
+            # 'spawn' starts fresh processes instead of forking this one, which
+            # is safer because the app runs uploads in background threads
+            context = multiprocessing.get_context('spawn')
+            _pdf_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pdf_pool_pid = os.getpid()
+        return _pdf_pool
+
+def _reset_pdf_pool():
+    """Forget the shared pool (used after a worker process crashed)."""
+    global _pdf_pool
+
+    with _pdf_pool_lock:
+        _pdf_pool = None
+
+def _extract_page_range(file_path, start, stop):
+    """
+    Extract and clean PDF pages start..stop-1 (runs in a worker process).
+
+    Each worker opens the PDF itself, because open files and PdfReader
+    objects can't be sent to another process.
+
+    Args:
+        file_path (str): Path to the PDF file
+        start (int): First page index
+        stop (int): Page index to stop before
+
+    Returns:
+        list: Cleaned text of each page (empty string for skipped pages)
+    """
+    import PyPDF2
+
+    parser = FileParser()
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [
+            parser._clean_pdf_text(pdf_reader.pages[i].extract_text())
+            for i in range(start, stop)
+        ]
 
 class FileParser:
     """
@@ -11,10 +99,25 @@ class FileParser:
     This class handles reading files, cleaning up the text, and returning it as a string.
     """
 
-    def __init__(self):
+    # Fixed attribute list - no per-instance __dict__ needed
+    __slots__ = ('supported_formats', 'pdf_workers', 'parallel_min_pages')
+
+    def __init__(self, pdf_workers=None, parallel_min_pages=20):
+        """
+        Set up the parser.
+
+        Args:
+            pdf_workers (int, optional): Processes used to extract large PDFs
+                                         (defaults to the CPU count, 1 disables it)
+            parallel_min_pages (int): Smallest PDF (in pages) worth extracting in
+                                      parallel; smaller PDFs are read in this process
+        """
         # List of supported file formats
         self.supported_formats = ['pdf', 'txt', 'docx', 'mp4', 'avi', 'mov', 'mkv', 'webm']
 
+        self.pdf_workers = pdf_workers or os.cpu_count() or 1
+        self.parallel_min_pages = parallel_min_pages
+
     def parse(self, file_path):
         """
         Parse file and extract text based on file type.
@@ -50,18 +153,31 @@ class FileParser:
         Returns:
             str: Cleaned text from the PDF
         """
-        text = ""
+        import PyPDF2
+
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                # Loop through all pages and extract text
-                for page_num, page in enumerate(pdf_reader.pages):
-                    page_text = page.extract_text()
-                    # Clean the text from each page
-                    page_text = self._clean_pdf_text(page_text)
-                    if page_text.strip():  # Only add non-empty pages
-                        text += page_text + "\n\n"
-                print(f" PDF extracted: {len(text)} characters from {len(pdf_reader.pages)} pages")
+                page_count = len(pdf_reader.pages)
+
+                # Large PDFs are split across worker processes (page parsing is
+                # pure Python, so threads wouldn't help); small ones aren't worth
+                # the cost of starting the workers
+                pages = None
+                if self.pdf_workers > 1 and page_count >= self.parallel_min_pages:
+                    try:
+                        pages = self._extract_pages_parallel(file_path, page_count)
+                    except BrokenProcessPool:
+                        # A worker died - start a new pool next time and
+                        # read this PDF here instead
+                        _reset_pdf_pool()
+                if pages is None:
+                    pages = [self._clean_pdf_text(page.extract_text()) for page in pdf_reader.pages]
+
+                # Keep the non-empty pages, joined once at the end
+                # (instead of growing one big string)
+                text = '\n'.join(page_text for page_text in pages if page_text)
+                print(f" PDF extracted: {len(text)} characters from {page_count} pages")
         except Exception as e:
             # If PyPDF2 fails, try pdfplumber as a backup
             try:
@@ -70,41 +186,83 @@ class FileParser:
             except ImportError:
                 raise Exception(f"Error parsing PDF: {str(e)}. Install pdfplumber for better extraction.")
 
-        # Final cleanup before returning
-        return self._final_text_cleanup(text)
+        if not text:
+            return "Unable to extract meaningful text from this PDF."
+        return text
+
+    def _extract_pages_parallel(self, file_path, page_count):
+        """
+        Extract and clean PDF pages using several worker processes.
+
+        The pages are split into one block per worker, and the results are
+        put back together in page order.
+
+        Args:
+            file_path (Path): Path to the PDF file
+            page_count (int): Number of pages in the PDF
+
+        Returns:
+            list: Cleaned text of each page, in order
+        """
+        workers = min(self.pdf_workers, page_count)
+        block_size = -(-page_count // workers)  # Round up
+        blocks = [(start, min(start + block_size, page_count))
+                  for start in range(0, page_count, block_size)]
+
+        executor = _get_pdf_pool(self.pdf_workers)
+        futures = [executor.submit(_extract_page_range, str(file_path), start, stop)
+                   for start, stop in blocks]
+
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+
+        return pages
 
     def _clean_pdf_text(self, raw_text):
         """
-        Clean raw text extracted from PDF.
+        Clean raw text extracted from one PDF page in a single pass.
+
+        All whitespace (including newlines) is collapsed, so a page becomes
+        one line of text. Pages with too little text are dropped.
 
         Args:
             raw_text (str): Raw text from PDF
 
         Returns:
-            str: Cleaned text
+            str: Cleaned text, or an empty string if nothing meaningful is left
         """
         if not raw_text:
             return ""
 
-        # Remove unwanted characters and artifacts
-        text = re.sub(r'[^\w\s\.\,\?\!\:\;\-\(\)\[\]\/]', ' ', raw_text)
+        # Cheap early exit for pages that are mostly symbols (scanned images,
+        # broken font encodings) - the regex engine counts the letters for us
+        length = len(raw_text)
+        if length > PDF_DENSITY_MIN_CHARS:
+            letters = len(_NON_LETTER_RE.sub('', raw_text))
+            if letters < length * PDF_MIN_LETTER_RATIO:
+                return ""
+
+        # Remove unwanted characters and artifacts (the table only covers
+        # ASCII, so anything else still goes through the regex)
+        if raw_text.isascii():
+            text = raw_text.translate(_PDF_NONTEXT_ASCII_TABLE)
+        else:
+            text = _PDF_NONTEXT_RE.sub(' ', raw_text)
         # Fix broken words (letters with spaces)
-        text = re.sub(r'\b([a-z])\s+([a-z])\s+([a-z])', r'\1\2\3', text)
-        # Remove extra spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _BROKEN_WORD_RE.sub(r'\1\2\3', text)
         # Remove single characters and numbers alone
-        text = re.sub(r'\b[0-9]\b|\b[a-zA-Z]\b', '', text)
-
-        # Remove lines with only symbols or short text
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            line = line.strip()
-            # Only keep lines with more than 3 words
-            if len(line.split()) >= 3:
-                cleaned_lines.append(line)
+        text = _SINGLE_CHAR_RE.sub('', text)
+        # Remove extra spaces (done last so the gaps left above collapse too)
+        text = _WS_RE.sub(' ', text).strip()
+
+        # Only keep text with at least 3 words. Words are now separated by
+        # exactly one space, so counting spaces is enough (no list of words).
+        # Three words always make at least 5 characters, so no length check.
+        if text.count(' ') < 2:
+            return ""
 
-        return '\n'.join(cleaned_lines)
+        return text
 
     def _parse_pdf_with_pdfplumber(self, file_path):
         """
@@ -118,45 +276,16 @@ class FileParser:
         """
         try:
             import pdfplumber
-            text = ""
+            pages = []
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
-                    page_text = page.extract_text()
+                    page_text = self._clean_pdf_text(page.extract_text())
                     if page_text:
-                        text += self._clean_pdf_text(page_text) + "\n\n"
-            return text
+                        pages.append(page_text)
+            return '\n'.join(pages)
         except Exception as e:
             raise Exception(f"pdfplumber extraction failed: {str(e)}")
 
-    def _final_text_cleanup(self, text):
-        """
-        Final cleanup of extracted text.
-
-        Args:
-            text (str): Text to clean
-
-        Returns:
-            str: Cleaned text ready for processing
-        """
-        if not text:
-            return "Unable to extract meaningful text from this PDF."
-
-        # Remove very short lines
-        lines = text.split('\n')
-        meaningful_lines = []
-        for line in lines:
-            line = line.strip()
-            # Keep lines with at least 5 characters and 2 words
-            if len(line) >= 5 and len(line.split()) >= 2:
-                meaningful_lines.append(line)
-
-        cleaned_text = '\n'.join(meaningful_lines)
-        # Limit consecutive newlines and spaces
-        cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)  # Max 2 newlines
-        cleaned_text = re.sub(r'[ \t]+', ' ', cleaned_text)     # Single spaces
-
-        return cleaned_text.strip()
-
     def _parse_txt(self, file_path):
         """
         Extract text from a TXT file.
@@ -167,13 +296,18 @@ class FileParser:
         Returns:
             str: Text content from the file
         """
+        # Read the whole file in one go and decode it ourselves
+        data = file_path.read_bytes()
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
+            text = data.decode('utf-8')
         except UnicodeDecodeError:
             # Try with different encoding if utf-8 fails
-            with open(file_path, 'r', encoding='latin-1') as file:
-                text = file.read()
+            text = data.decode('latin-1')
+
+        # Turn Windows/old Mac line endings into \n (text mode used to do this)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
         return text.strip()
 
     def _parse_docx(self, file_path):
@@ -186,6 +320,8 @@ class FileParser:
         Returns:
             str: Text content from the file
         """
+        import docx
+
         try:
             doc = docx.Document(file_path)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
@@ -206,12 +342,12 @@ class FileParser:
         try:
             # Import video processor only when needed
             from src.core.video_processor import VideoProcessor
+            from src.utils.config import Config
 
-            processor = VideoProcessor()
+            processor = VideoProcessor(max_chunks=Config.VIDEO_MAX_CHUNKS)
             transcript = processor.extract_text_from_video(file_path)
 
             # Save transcript to file for later use
-            from src.utils.config import Config
             transcript_path = Config.TRANSCRIPTS_FOLDER / f"{file_path.stem}_transcript.json"
             processor.save_transcript(transcript, transcript_path)
 
@@ -1,8 +1,130 @@
 # ========== Imports ==========
 import re
-from nltk.tokenize import sent_tokenize
 import random
 
+# pyahocorasick is optional - it finds every topic in a sentence in one scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Sentence boundary: whitespace after . ! or ? that is followed by a capital letter
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+# ========== Indicator Patterns ==========
+# Each word list is compiled into one regex, so a sentence is scanned once
+# instead of once per word. They are plain substring matches, just like
+# the `word in sentence` checks they replace.
+
+def _compile_indicators(words):
+    """Compile a list of words/phrases into a single alternation regex."""
+    return re.compile('|'.join(re.escape(word) for word in words))
+
+# Words that usually indicate definitions
+_DEF_RE = _compile_indicators([
+    'is', 'are', 'refers to', 'defined as', 'means', 'represents',
+    'consists of', 'includes', 'involves', 'characterized by'
+])
+# Words that indicate comparisons
+_CMP_RE = _compile_indicators(['difference', 'compare', 'versus', 'vs', 'unlike', 'similar', 'contrast'])
+# Words that indicate features or characteristics
+_FEAT_RE = _compile_indicators(['characteristics', 'features', 'properties', 'advantages', 'benefits', 'types'])
+# Words that indicate processes or methods
+_PROC_RE = _compile_indicators(['process', 'steps', 'procedure', 'method', 'approach', 'technique'])
+# Words that indicate complex concepts (used for difficulty)
+_COMPLEX_RE = _compile_indicators(['implementation', 'architecture', 'methodology', 'paradigm', 'algorithm'])
+
+def _truncate_two_sentences(text):
+    """
+    Keep only the first two '.'-separated pieces of a text.
+
+    Gives the same result as ". ".join(text.split('.')[:2]) + "." but only
+    looks for the first two dots instead of splitting the whole text.
+
+    Args:
+        text (str): Text to shorten
+
+    Returns:
+        str: The first two pieces joined with ". " and ending with "."
+    """
+    first_dot = text.find('.')
+    if first_dot == -1:
+        return text + "."
+
+    second_dot = text.find('.', first_dot + 1)
+    second_piece = text[first_dot + 1:second_dot] if second_dot != -1 else text[first_dot + 1:]
+    return text[:first_dot] + ". " + second_piece + "."
+
+def _longest_first(topics, limit):
+    """
+    Order the indexes of the first `limit` topics from longest to shortest.
+
+    Longer topics (like "Machine Learning") are more specific than short ones
+    (like "AI"), so checking them first gives each sentence its most
+    specific topic. Topics of the same length keep their ranking order.
+
+    Args:
+        topics (list): List of key topics
+        limit (int): How many of the top topics to consider
+
+    Returns:
+        list: Topic indexes, longest topic first
+    """
+    return sorted(range(min(limit, len(topics))), key=lambda i: len(topics[i]), reverse=True)
+
+# ========== Flashcard Record ==========
+
+class Flashcard:
+    """
+    One generated flashcard.
+
+    Cards are built as small fixed-layout objects while generating (no
+    per-card dict), and turned into plain dictionaries with to_dict() only
+    when they are handed back to the rest of the app.
+    """
+
+    __slots__ = ('question', 'answer', 'topic', 'type', 'id', 'difficulty',
+                 'answer_lower', 'word_count')
+
+    def __init__(self, question, answer, topic, card_type, answer_lower=None, word_count=None):
+        """
+        Create a flashcard.
+
+        Args:
+            question (str): Question text
+            answer (str): Answer text
+            topic (str): Topic the card is about
+            card_type (str): Kind of card ('definition', 'comparison', ...)
+            answer_lower (str, optional): Lowercase answer, if already known
+            word_count (int, optional): Number of words in the answer, if already known
+        """
+        self.question = question
+        self.answer = answer
+        self.topic = topic
+        self.type = card_type
+        self.id = 0
+        self.difficulty = 'medium'
+        # Only used while assigning difficulty, never exported
+        self.answer_lower = answer_lower
+        self.word_count = word_count
+
+    def to_dict(self):
+        """
+        Convert the card to the dictionary format used by the database,
+        the JSON/CSV exports and the templates.
+
+        Returns:
+            dict: question, answer, topic, type, id and difficulty
+        """
+        return {
+            'question': self.question,
+            'answer': self.answer,
+            'topic': self.topic,
+            'type': self.type,
+            'id': self.id,
+            'difficulty': self.difficulty
+        }
+
 class FlashcardGenerator:
     """
     Generate flashcards from text content using dynamic methods.
@@ -14,6 +136,9 @@ class FlashcardGenerator:
     - Generating feature and process questions
     """
 
+    # Fixed attribute list - no per-instance __dict__ needed
+    __slots__ = ('question_patterns',)
+
     def __init__(self):
         # Pre-defined question patterns to look for in text
         self.question_patterns = [
@@ -24,7 +149,7 @@ class FlashcardGenerator:
             r'(.*?) refers to (.*?)[\.\?]'
         ]
 
-    def generate(self, text, topics, num_cards=20):
+    def generate(self, text, topics, num_cards=20, sentences=None, use_nltk=False):
         """
         Generate flashcards from text using multiple methods.
 
@@ -32,49 +157,117 @@ class FlashcardGenerator:
             text (str): The source text to create flashcards from
             topics (list): List of key topics found in the text
             num_cards (int): Maximum number of flashcards to generate
+            sentences (list, optional): Text already split into sentences
+            use_nltk (bool): Split with NLTK's Punkt tokenizer instead of the
+                             faster regex splitter (only used without sentences)
 
         Returns:
             list: List of flashcard dictionaries with questions and answers
         """
         flashcards = []
-        sentences = sent_tokenize(text)
+        # Only split the text if the caller didn't already do it
+        if sentences is None:
+            if use_nltk:
+                from nltk.tokenize import sent_tokenize
+                sentences = sent_tokenize(text)
+            else:
+                sentences = [s for s in _SENT_SPLIT_RE.split(text) if s.strip()]
 
         print(f"Generating flashcards from {len(sentences)} sentences")
         print(f"Topics available: {topics[:5]}")
 
+        # Prepare each sentence once (stripped text, lowercase text, word count,
+        # indexes of the topics it mentions) so the methods below don't redo
+        # this work for every topic
+        sentences_lower = [s.lower() for s in sentences]
+        topic_hits = self._match_topics(sentences_lower, [t.lower() for t in topics])
+        sent_cache = [
+            (s.strip(), s_lower, len(s.split()), hits)
+            for s, s_lower, hits in zip(sentences, sentences_lower, topic_hits)
+        ]
+
+        # Questions already used by any method, so duplicates are skipped
+        # before their answers are built
+        seen = set()
+
         # Method 1: Extract definition-like sentences
-        definition_cards = self._extract_definition_cards(sentences, topics, text)
+        definition_cards = self._extract_definition_cards(sent_cache, topics, seen)
         flashcards.extend(definition_cards)
 
         # Method 2: Generate concept questions from content
-        concept_cards = self._generate_concept_questions(text, topics, sentences)
+        concept_cards = self._generate_concept_questions(sent_cache, topics, seen)
         flashcards.extend(concept_cards)
 
         # Method 3: Generate comparison questions
-        comparison_cards = self._generate_comparison_questions(text, topics, sentences)
+        comparison_cards = self._generate_comparison_questions(sent_cache, topics, seen)
         flashcards.extend(comparison_cards)
 
         # Method 4: Generate feature/characteristic questions
-        feature_cards = self._generate_feature_questions(text, topics, sentences)
+        feature_cards = self._generate_feature_questions(sent_cache, topics, seen)
         flashcards.extend(feature_cards)
 
         # Method 5: Generate process/how questions
-        process_cards = self._generate_process_questions(text, topics, sentences)
+        process_cards = self._generate_process_questions(sent_cache, topics, seen)
         flashcards.extend(process_cards)
 
-        # Remove duplicates and limit to requested number
-        flashcards = self._remove_duplicates(flashcards)
+        # Limit to requested number
         flashcards = flashcards[:num_cards]
 
         # Add metadata to each flashcard
         for i, card in enumerate(flashcards):
-            card['id'] = i + 1
-            card['difficulty'] = self._assign_difficulty(card)
+            card.id = i + 1
+            card.difficulty = self._assign_difficulty(card)
 
         print(f" Generated {len(flashcards)} flashcards")
-        return flashcards
+        return [card.to_dict() for card in flashcards]
+
+    def _match_topics(self, sentences_lower, topics_lower):
+        """
+        Find which topics appear in each sentence.
+
+        Uses an Aho-Corasick automaton (when pyahocorasick is installed) to
+        find all topics in a sentence with a single scan, instead of
+        checking every topic separately. The automaton is built per call
+        because topics change with every document.
 
-    def _extract_definition_cards(self, sentences, topics, full_text):
+        Args:
+            sentences_lower (list): Lowercase sentences
+            topics_lower (list): Lowercase topics
+
+        Returns:
+            list: One set of topic indexes per sentence
+        """
+        # Group topic indexes by text (the same topic may be listed twice)
+        positions = {}
+        for i, topic_lower in enumerate(topics_lower):
+            positions.setdefault(topic_lower, []).append(i)
+
+        # An empty topic matches every sentence (like the `in` operator)
+        always = set(positions.pop('', []))
+
+        if ahocorasick is None or not positions:
+            # Fallback: check each topic once per sentence
+            return [
+                always | {i for topic_lower, indexes in positions.items()
+                          if topic_lower in sentence_lower for i in indexes}
+                for sentence_lower in sentences_lower
+            ]
+
+        automaton = ahocorasick.Automaton()
+        for topic_lower, indexes in positions.items():
+            automaton.add_word(topic_lower, indexes)
+        automaton.make_automaton()
+
+        topic_hits = []
+        for sentence_lower in sentences_lower:
+            hits = set(always)
+            for _, indexes in automaton.iter(sentence_lower):
+                hits.update(indexes)
+            topic_hits.append(hits)
+
+        return topic_hits
+
+    def _extract_definition_cards(self, sent_cache, topics, seen):
         """
         Extract definition-like sentences and turn them into Q&A pairs.
 
@@ -82,58 +275,60 @@ class FlashcardGenerator:
         "is", "means", "refers to", etc.
 
         Args:
-            sentences (list): List of sentences from the text
+            sent_cache (list): (sentence, lowercase sentence, word count, topic indexes) tuples
             topics (list): List of key topics
-            full_text (str): Complete text for context
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of definition-based flashcards
+            list: List of definition-based Flashcard objects
         """
         cards = []
+        # Topics to look for, checked longest (most specific) first
+        candidates = _longest_first(topics, 10)
 
-        # Words that usually indicate definitions
-        definition_indicators = [
-            'is', 'are', 'refers to', 'defined as', 'means', 'represents',
-            'consists of', 'includes', 'involves', 'characterized by'
-        ]
-
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
+        for sentence, sentence_lower, word_count, hits in sent_cache:
+            # Stop once we have the maximum of 8 definition cards
+            if len(cards) >= 8:
+                break
 
             # Check if sentence contains definition indicators
-            if any(indicator in sentence_lower for indicator in definition_indicators):
-                # Find which topic this sentence is about
-                for topic in topics[:10]:
-                    if topic.lower() in sentence_lower and len(sentence.split()) > 5:
+            if _DEF_RE.search(sentence_lower):
+                # Find which topic this sentence is about (most specific first)
+                for i in candidates:
+                    if i in hits and word_count > 5:
+                        topic = topics[i]
                         # Create definition question
                         question = f"What is {topic}?"
-                        answer = sentence.strip()
+                        answer = sentence
 
                         # Make sure answer is long enough to be meaningful
-                        if len(answer.split()) >= 8:
-                            cards.append({
-                                'question': question,
-                                'answer': answer,
-                                'topic': topic,
-                                'type': 'definition'
-                            })
+                        if word_count >= 8 and self._is_new_question(question, seen):
+                            cards.append(Flashcard(
+                                question=question,
+                                answer=answer,
+                                topic=topic,
+                                card_type='definition',
+                                # The answer is the whole sentence, so reuse its cached values
+                                answer_lower=sentence_lower,
+                                word_count=word_count
+                            ))
                         break
 
-        return cards[:8]  # Return maximum 8 definition cards
+        return cards
 
-    def _generate_concept_questions(self, text, topics, sentences):
+    def _generate_concept_questions(self, sent_cache, topics, seen):
         """
         Generate concept-based questions from content.
 
         Creates various types of questions about each topic using templates.
 
         Args:
-            text (str): Source text
+            sent_cache (list): (sentence, lowercase sentence, word count, topic indexes) tuples
             topics (list): List of key topics
-            sentences (list): List of sentences
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of concept-based flashcards
+            list: List of concept-based Flashcard objects
         """
         cards = []
 
@@ -148,191 +343,219 @@ class FlashcardGenerator:
             ("Why is {} important?", "importance")
         ]
 
-        for topic in topics[:15]:
+        for i, topic in enumerate(topics[:15]):
+            # Stop once we have the maximum of 10 concept cards
+            if len(cards) >= 10:
+                break
+
             # Find sentences that talk about this topic
-            related_sentences = []
-            for sentence in sentences:
-                if topic.lower() in sentence.lower() and len(sentence.split()) > 6:
-                    related_sentences.append(sentence.strip())
+            related_sentences = [
+                sentence for sentence, _, word_count, hits in sent_cache
+                if i in hits and word_count > 6
+            ]
 
             if related_sentences:
                 # Pick a random question template
                 template, card_type = random.choice(concept_templates)
                 question = template.format(topic)
 
+                # Skip the answer work if another card already asks this
+                if not self._is_new_question(question, seen):
+                    continue
+
                 # Use 1-2 most relevant sentences as the answer
                 answer = ". ".join(related_sentences[:2])
 
                 # Keep answer length reasonable
                 if len(answer.split()) > 50:
-                    answer = ". ".join(answer.split('.')[:2]) + "."
+                    answer = _truncate_two_sentences(answer)
 
-                cards.append({
-                    'question': question,
-                    'answer': answer,
-                    'topic': topic,
-                    'type': card_type
-                })
+                cards.append(Flashcard(
+                    question=question,
+                    answer=answer,
+                    topic=topic,
+                    card_type=card_type
+                ))
 
-        return cards[:10]  # Return maximum 10 concept cards
+        return cards
 
-    def _generate_comparison_questions(self, text, topics, sentences):
+    def _generate_comparison_questions(self, sent_cache, topics, seen):
         """
         Generate comparison questions between different concepts.
 
         Looks for sentences that compare or contrast topics.
 
         Args:
-            text (str): Source text
+            sent_cache (list): (sentence, lowercase sentence, word count, topic indexes) tuples
             topics (list): List of key topics
-            sentences (list): List of sentences
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of comparison flashcards
+            list: List of comparison Flashcard objects
         """
         cards = []
 
-        # Words that indicate comparisons
-        comparison_words = ['difference', 'compare', 'versus', 'vs', 'unlike', 'similar', 'contrast']
-
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
+        for sentence, sentence_lower, word_count, hits in sent_cache:
+            # Stop once we have the maximum of 3 comparison cards
+            if len(cards) >= 3:
+                break
 
-            if any(word in sentence_lower for word in comparison_words):
-                # Find topics mentioned in this sentence
-                mentioned_topics = [topic for topic in topics if topic.lower() in sentence_lower]
+            # Check if sentence contains comparison words
+            if _CMP_RE.search(sentence_lower):
+                # Find topics mentioned in this sentence (in topic order)
+                mentioned_topics = [topics[i] for i in sorted(hits)]
 
                 if len(mentioned_topics) >= 2:
                     topic1, topic2 = mentioned_topics[:2]
                     question = f"What is the difference between {topic1} and {topic2}?"
-                    answer = sentence.strip()
+                    answer = sentence
 
-                    cards.append({
-                        'question': question,
-                        'answer': answer,
-                        'topic': f"{topic1} vs {topic2}",
-                        'type': 'comparison'
-                    })
+                    if not self._is_new_question(question, seen):
+                        continue
 
-        return cards[:3]  # Return maximum 3 comparison cards
+                    cards.append(Flashcard(
+                        question=question,
+                        answer=answer,
+                        topic=f"{topic1} vs {topic2}",
+                        card_type='comparison',
+                        answer_lower=sentence_lower,
+                        word_count=word_count
+                    ))
 
-    def _generate_feature_questions(self, text, topics, sentences):
+        return cards
+
+    def _generate_feature_questions(self, sent_cache, topics, seen):
         """
         Generate questions about features and characteristics of topics.
 
         Looks for sentences that describe properties or features.
 
         Args:
-            text (str): Source text
+            sent_cache (list): (sentence, lowercase sentence, word count, topic indexes) tuples
             topics (list): List of key topics
-            sentences (list): List of sentences
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of feature-based flashcards
+            list: List of feature-based Flashcard objects
         """
         cards = []
-
-        # Words that indicate features or characteristics
-        feature_words = ['characteristics', 'features', 'properties', 'advantages', 'benefits', 'types']
-
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-
-            if any(word in sentence_lower for word in feature_words):
-                for topic in topics[:10]:
-                    if topic.lower() in sentence_lower and len(sentence.split()) > 8:
+        # Topics to look for, checked longest (most specific) first
+        candidates = _longest_first(topics, 10)
+
+        for sentence, sentence_lower, word_count, hits in sent_cache:
+            # Stop once we have the maximum of 5 feature cards
+            if len(cards) >= 5:
+                break
+
+            # Check if sentence contains feature words
+            if _FEAT_RE.search(sentence_lower):
+                for i in candidates:
+                    if i in hits and word_count > 8:
+                        topic = topics[i]
                         question = f"What are the key characteristics of {topic}?"
-                        answer = sentence.strip()
-
-                        cards.append({
-                            'question': question,
-                            'answer': answer,
-                            'topic': topic,
-                            'type': 'features'
-                        })
+                        answer = sentence
+
+                        if self._is_new_question(question, seen):
+                            cards.append(Flashcard(
+                                question=question,
+                                answer=answer,
+                                topic=topic,
+                                card_type='features',
+                                # The answer is the whole sentence, so reuse its cached values
+                                answer_lower=sentence_lower,
+                                word_count=word_count
+                            ))
                         break
 
-        return cards[:5]  # Return maximum 5 feature cards
+        return cards
 
-    def _generate_process_questions(self, text, topics, sentences):
+    def _generate_process_questions(self, sent_cache, topics, seen):
         """
         Generate process/how-to questions about topics.
 
         Looks for sentences that describe processes, methods, or procedures.
 
         Args:
-            text (str): Source text
+            sent_cache (list): (sentence, lowercase sentence, word count, topic indexes) tuples
             topics (list): List of key topics
-            sentences (list): List of sentences
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of process-based flashcards
+            list: List of process-based Flashcard objects
         """
         cards = []
-
-        # Words that indicate processes or methods
-        process_words = ['process', 'steps', 'procedure', 'method', 'approach', 'technique']
-
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-
-            if any(word in sentence_lower for word in process_words):
-                for topic in topics[:8]:
-                    if topic.lower() in sentence_lower and len(sentence.split()) > 6:
+        # Topics to look for, checked longest (most specific) first
+        candidates = _longest_first(topics, 8)
+
+        for sentence, sentence_lower, word_count, hits in sent_cache:
+            # Stop once we have the maximum of 4 process cards
+            if len(cards) >= 4:
+                break
+
+            # Check if sentence contains process words
+            if _PROC_RE.search(sentence_lower):
+                for i in candidates:
+                    if i in hits and word_count > 6:
+                        topic = topics[i]
                         question = f"How does {topic} work?"
-                        answer = sentence.strip()
-
-                        cards.append({
-                            'question': question,
-                            'answer': answer,
-                            'topic': topic,
-                            'type': 'process'
-                        })
+                        answer = sentence
+
+                        if self._is_new_question(question, seen):
+                            cards.append(Flashcard(
+                                question=question,
+                                answer=answer,
+                                topic=topic,
+                                card_type='process',
+                                # The answer is the whole sentence, so reuse its cached values
+                                answer_lower=sentence_lower,
+                                word_count=word_count
+                            ))
                         break
 
         return cards[:4]  # Return maximum 4 process cards
 
-    def _remove_duplicates(self, flashcards):
+    def _is_new_question(self, question, seen):
         """
-        Remove duplicate flashcards based on similar questions.
+        Check if a question hasn't been used yet, and remember it if so.
+
+        Questions are compared in lowercase without surrounding spaces,
+        so "What is X?" and "what is x?" count as the same question.
 
         Args:
-            flashcards (list): List of flashcard dictionaries
+            question (str): Question text
+            seen (set): Normalized questions already used (updated in place)
 
         Returns:
-            list: List of unique flashcards
+            bool: True if the question is new
         """
-        seen_questions = set()
-        unique_cards = []
-
-        for card in flashcards:
-            # Normalize question text for comparison
-            question_normalized = card['question'].lower().strip()
-
-            if question_normalized not in seen_questions:
-                seen_questions.add(question_normalized)
-                unique_cards.append(card)
-
-        return unique_cards
+        key = question.lower().strip()
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
 
     def _assign_difficulty(self, card):
         """
         Assign difficulty level based on answer complexity.
 
-        Considers answer length and presence of complex terms.
+        Considers answer length and presence of complex terms. Uses the
+        lowercase answer and word count cached on the card when the card
+        builder stored them.
 
         Args:
-            card (dict): Flashcard dictionary
+            card (Flashcard): Flashcard to rate
 
         Returns:
             str: Difficulty level ('easy', 'medium', or 'hard')
         """
-        answer = card['answer']
-        answer_length = len(answer.split())
-
-        # Words that indicate complex concepts
-        complex_terms = ['implementation', 'architecture', 'methodology', 'paradigm', 'algorithm']
-        has_complex_terms = any(term in answer.lower() for term in complex_terms)
+        answer_lower = card.answer_lower
+        answer_length = card.word_count
+        if answer_lower is None:
+            answer_lower = card.answer.lower()
+        if answer_length is None:
+            answer_length = len(card.answer.split())
+
+        has_complex_terms = _COMPLEX_RE.search(answer_lower) is not None
 
         # Determine difficulty based on length and complexity
         if answer_length < 15 and not has_complex_terms:
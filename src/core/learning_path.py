@@ -1,5 +1,5 @@
 # ========== Imports ==========
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 class LearningPathGenerator:
     """
@@ -12,6 +12,9 @@ class LearningPathGenerator:
     - Creating prerequisites between topics
     """
 
+    # Fixed attribute list - no per-instance __dict__ needed
+    __slots__ = ('difficulty_weights',)
+
     def __init__(self):
         # Difficulty weights for time estimation
         self.difficulty_weights = {
@@ -31,19 +34,27 @@ class LearningPathGenerator:
         Returns:
             dict: Complete learning path with steps, time estimates, and progression
         """
-        # Group flashcards by their topics for easier processing
-        topic_cards = self._group_by_topic(flashcards)
+        # We only ever need each card's topic and difficulty here, so pull those
+        # out once into two flat lists instead of walking the full card dicts
+        topics_arr = [card.get('topic', 'General') for card in flashcards]
+        difficulties_arr = [card.get('difficulty', 'medium') for card in flashcards]
+
+        # Group flashcards (by index) by their topics for easier processing
+        topic_indices = self._group_by_topic(topics_arr)
 
         # Create individual learning steps for each topic
-        steps = self._create_learning_steps(topics, topic_cards)
+        steps = self._create_learning_steps(topics, topic_indices, difficulties_arr)
 
         # Calculate estimated study time for each step
         for step in steps:
             step['estimated_time'] = self._estimate_time(step)
 
         # Set up prerequisites (what needs to be learned first)
-        for i, step in enumerate(steps):
-            step['prerequisites'] = [steps[j]['topic'] for j in range(i) if j < i]
+        # Each step needs every topic before it, so grow one list as we go
+        prerequisites = []
+        for step in steps:
+            step['prerequisites'] = list(prerequisites)
+            prerequisites.append(step['topic'])
 
         # Build the complete learning path structure
         learning_path = {
@@ -55,28 +66,26 @@ class LearningPathGenerator:
 
         return learning_path
 
-    def _group_by_topic(self, flashcards):
+    def _group_by_topic(self, topics_arr):
         """
         Group flashcards by their topics.
 
         This helps us see how many flashcards belong to each topic.
 
         Args:
-            flashcards (list): List of flashcard dictionaries
+            topics_arr (list): Topic of each flashcard, in flashcard order
 
         Returns:
-            dict: Dictionary with topics as keys and lists of flashcards as values
+            dict: Dictionary with topics as keys and lists of flashcard indices as values
         """
-        topic_cards = defaultdict(list)
+        topic_indices = defaultdict(list)
 
-        for card in flashcards:
-            # Get the topic of this flashcard (default to 'General' if not specified)
-            topic = card.get('topic', 'General')
-            topic_cards[topic].append(card)
+        for index, topic in enumerate(topics_arr):
+            topic_indices[topic].append(index)
 
-        return dict(topic_cards)
+        return dict(topic_indices)
 
-    def _create_learning_steps(self, topics, topic_cards):
+    def _create_learning_steps(self, topics, topic_indices, difficulties_arr):
         """
         Create individual learning steps from topics.
 
@@ -84,7 +93,8 @@ class LearningPathGenerator:
 
         Args:
             topics (list): List of topics to create steps for
-            topic_cards (dict): Dictionary of flashcards grouped by topic
+            topic_indices (dict): Flashcard indices grouped by topic
+            difficulties_arr (list): Difficulty of each flashcard, in flashcard order
 
         Returns:
             list: List of learning step dictionaries
@@ -94,10 +104,13 @@ class LearningPathGenerator:
         # Create a step for each topic (maximum 10 steps to keep it manageable)
         for i, topic in enumerate(topics[:10]):
             # Count how many flashcards are available for this topic
-            num_cards = len(topic_cards.get(topic, []))
+            indices = topic_indices.get(topic, [])
+            num_cards = len(indices)
 
             # Determine how difficult this step will be
-            difficulty = self._determine_step_difficulty(topic_cards.get(topic, []))
+            difficulty = self._determine_step_difficulty(
+                [difficulties_arr[j] for j in indices]
+            )
 
             # Create the step structure
             step = {
@@ -113,33 +126,30 @@ class LearningPathGenerator:
 
         return steps
 
-    def _determine_step_difficulty(self, cards):
+    def _determine_step_difficulty(self, difficulties):
         """
         Determine the difficulty level of a learning step based on its flashcards.
 
         Looks at the difficulty of individual flashcards to decide overall step difficulty.
 
         Args:
-            cards (list): List of flashcards for this topic
+            difficulties (list): Difficulty level of each flashcard for this topic
 
         Returns:
             str: Difficulty level ('easy', 'medium', or 'hard')
         """
-        if not cards:
+        if not difficulties:
             return 'medium'  # Default difficulty if no cards available
 
-        # Get difficulty levels of all flashcards
-        difficulties = [card.get('difficulty', 'medium') for card in cards]
-
-        # Count how many cards are at each difficulty level
-        easy_count = difficulties.count('easy')
-        medium_count = difficulties.count('medium')
-        hard_count = difficulties.count('hard')
+        # Count how many cards are at each difficulty level in a single pass
+        counts = Counter(difficulties)
+        easy_count = counts['easy']
+        hard_count = counts['hard']
 
         # Determine overall difficulty based on card distribution
-        if hard_count > len(cards) * 0.5:  # More than 50% hard cards
+        if hard_count > len(difficulties) * 0.5:  # More than 50% hard cards
             return 'hard'
-        elif easy_count > len(cards) * 0.5:  # More than 50% easy cards
+        elif easy_count > len(difficulties) * 0.5:  # More than 50% easy cards
             return 'easy'
         else:
             return 'medium'  # Mixed or mostly medium cards
@@ -181,12 +191,7 @@ class LearningPathGenerator:
         Returns:
             list: List of dictionaries showing step number and difficulty
         """
-        progression = []
-
-        for step in steps:
-            progression.append({
-                'step': step['step_number'],
-                'difficulty': step['difficulty']
-            })
-
-        return progression
\ No newline at end of file
+        return [
+            {'step': step['step_number'], 'difficulty': step['difficulty']}
+            for step in steps
+        ]
\ No newline at end of file
@@ -1,6 +1,20 @@
-from nltk.tokenize import sent_tokenize
-from collections import Counter
+from sklearn.feature_extraction.text import TfidfVectorizer
+import heapq
 import re
+import numpy as np
+
+# Sentence splitting shares TextProcessor's cache, so a document processed
+# by both is split (and its sentences kept in memory) only once
+from src.core.text_processor import _cached_sentences
+
+# Compiled once at import instead of on every call
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')    # Words of 3+ letters
+_PARA_SPLIT_RE = re.compile(r'\n\n+')          # Blank lines between sections
+_NON_SPACE_RE = re.compile(r'\S+')             # Words, the same way str.split() sees them
+# Words that mark a sentence as a key point. Only the start of the word is
+# anchored, so "keys" and "mainly" count but "monkey" and "domain" don't
+_KEYWORD_RE = re.compile(r'\b(?:important|key|main|primary|essential|critical|'
+                         r'significant|fundamental|core|major)')
 
 class SummaryGenerator:
     """Generate summaries from text content"""
@@ -8,29 +22,36 @@ class SummaryGenerator:
     def __init__(self):
         pass
     
-    def generate(self, text, ratio=0.3):
+    def generate(self, text, ratio=0.3, sentences=None):
         """
         Generate summary using extractive summarization
         
         Args:
             text (str): Source text
             ratio (float): Ratio of sentences to keep (0.0 to 1.0)
+            sentences (list, optional): Text already split into sentences
             
         Returns:
             dict: Summary with full text and key points
         """
-        sentences = sent_tokenize(text)
+        if sentences is None:
+            sentences = list(_cached_sentences(text))
+        
+        # Score sentences (one score per sentence, same order)
+        scores = self._score_sentences(sentences)
         
-        # Score sentences
-        sentence_scores = self._score_sentences(sentences, text)
+        # A sentence that appears more than once only competes once, at its
+        # first position (dicts keep insertion order, so indexes stay sorted)
+        first_index = {}
+        for i, sentence in enumerate(sentences):
+            first_index.setdefault(sentence, i)
         
-        # Select top sentences
+        # Select top sentences without sorting all of them
         num_sentences = max(3, int(len(sentences) * ratio))
-        top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
+        top_indexes = heapq.nlargest(num_sentences, first_index.values(), key=scores.__getitem__)
         
         # Sort by original order
-        summary_sentences = sorted(top_sentences, key=lambda x: sentences.index(x[0]))
-        summary_text = " ".join([s[0] for s in summary_sentences])
+        summary_text = " ".join(sentences[i] for i in sorted(top_indexes))
         
         # Extract key points
         key_points = self._extract_key_points(text, sentences)
@@ -43,31 +64,41 @@ class SummaryGenerator:
             'compression_ratio': len(summary_text.split()) / len(text.split())
         }
     
-    def _score_sentences(self, sentences, full_text):
-        """Score sentences based on word frequency"""
-        # Get word frequency
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', full_text.lower())
-        word_freq = Counter(words)
-        
-        # Score each sentence
-        sentence_scores = {}
-        for sentence in sentences:
-            sentence_words = re.findall(r'\b[a-zA-Z]{3,}\b', sentence.lower())
-            score = sum([word_freq.get(word, 0) for word in sentence_words])
-            sentence_scores[sentence] = score / (len(sentence_words) + 1)
-        
-        return sentence_scores
+    def _score_sentences(self, sentences):
+        """
+        Score sentences with TF-IDF (each sentence is treated as a document).
+
+        Words that appear in every sentence count for little, words that are
+        specific to a few sentences count for more. A sentence's score is the
+        sum of its TF-IDF weights divided by (number of distinct words + 1).
+
+        Returns:
+            list: One score per sentence, in the same order
+        """
+        # A new vectorizer per call: fitting changes it, and the same
+        # SummaryGenerator is shared by the background processing threads
+        vectorizer = TfidfVectorizer(
+            token_pattern=_WORD_RE.pattern,
+            stop_words='english',
+            lowercase=True,
+            dtype=np.float32
+        )
+        try:
+            matrix = vectorizer.fit_transform(sentences)
+        except ValueError:
+            # No usable words at all (e.g. only stopwords or numbers)
+            return [0.0] * len(sentences)
+        
+        scores = np.asarray(matrix.sum(axis=1)).ravel() / (matrix.getnnz(axis=1) + 1)
+        return scores.tolist()
     
     def _extract_key_points(self, text, sentences):
         """Extract key points (bullet points)"""
         key_points = []
         
-        # Look for sentences with important keywords
-        important_keywords = ['important', 'key', 'main', 'primary', 'essential', 'critical', 
-                             'significant', 'fundamental', 'core', 'major']
-        
+        # Look for sentences with important keywords (one regex search each)
         for sentence in sentences[:30]:  # Check first 30 sentences
-            if any(keyword in sentence.lower() for keyword in important_keywords):
+            if _KEYWORD_RE.search(sentence.lower()):
                 key_points.append(sentence.strip())
             
             if len(key_points) >= 5:
@@ -84,9 +115,13 @@ class SummaryGenerator:
         # Simple chapter detection based on headings or paragraph breaks
         chapters = self._split_into_chapters(text)
         
+        # Tokenize the whole text once and hand each chapter its own sentences,
+        # instead of running the sentence tokenizer again for every chapter
+        chapter_sentences = self._sentences_by_chapter(text, chapters)
+        
         summaries = []
-        for i, chapter in enumerate(chapters):
-            summary = self.generate(chapter, ratio=0.3)
+        for i, ((chapter, _, _), sentences) in enumerate(zip(chapters, chapter_sentences)):
+            summary = self.generate(chapter, ratio=0.3, sentences=sentences)
             summaries.append({
                 'chapter_number': i + 1,
                 'summary': summary['summary'],
@@ -95,21 +130,77 @@ class SummaryGenerator:
         
         return summaries
     
+    def _sentences_by_chapter(self, text, chapters):
+        """
+        Split the whole text into sentences once and group them by chapter.
+        
+        Each sentence goes to the chapter its first character falls in.
+        Sentences are also cut at blank lines, because chapters are split
+        there but the sentence tokenizer does not break on them. A chapter
+        that gets no sentences this way gets None, so generate() tokenizes
+        that chapter on its own as before.
+        
+        Args:
+            text (str): Full text
+            chapters (list): (chapter text, start, end) tuples from _split_into_chapters
+            
+        Returns:
+            list: One list of sentences (or None) per chapter
+        """
+        grouped = [[] for _ in chapters]
+        pos = 0
+        for sentence in _cached_sentences(text):
+            # Sentences are pieces of the text, in order, so look just ahead
+            sentence_start = text.find(sentence, pos)
+            if sentence_start == -1:
+                continue
+            pos = sentence_start + len(sentence)
+            
+            # Cut the sentence at blank lines (start offset, text) pieces
+            piece_start = 0
+            pieces = []
+            for match in _PARA_SPLIT_RE.finditer(sentence):
+                pieces.append((piece_start, sentence[piece_start:match.start()]))
+                piece_start = match.end()
+            pieces.append((piece_start, sentence[piece_start:]))
+            
+            for offset, piece in pieces:
+                piece = piece.strip()
+                if not piece:
+                    continue
+                start = sentence_start + offset
+                for index, (chapter, chapter_start, chapter_end) in enumerate(chapters):
+                    if chapter_start <= start < chapter_end:
+                        # Equal-size chapters are re-joined with single spaces,
+                        # so their sentences should be too
+                        if chapter != text[chapter_start:chapter_end]:
+                            piece = " ".join(piece.split())
+                        grouped[index].append(piece)
+                        break
+        
+        return [sentences or None for sentences in grouped]
+    
     def _split_into_chapters(self, text):
-        """Split text into chapters (simple version)"""
-        # Split by double newlines or section markers
-        chapters = re.split(r'\n\n+', text)
+        """Split text into chapters (simple version), as (chapter text, start, end) tuples"""
+        # Split by double newlines or section markers, remembering where each
+        # section sits in the text
+        chapters = []
+        start = 0
+        for match in _PARA_SPLIT_RE.finditer(text):
+            chapters.append((text[start:match.start()], start, match.start()))
+            start = match.end()
+        chapters.append((text[start:], start, len(text)))
         
         # Filter out very short sections
-        chapters = [ch for ch in chapters if len(ch.split()) > 50]
+        chapters = [ch for ch in chapters if len(ch[0].split()) > 50]
         
         # If no clear chapters, split into equal parts
         if len(chapters) < 2:
-            words = text.split()
+            words = [(m.group(), m.start(), m.end()) for m in _NON_SPACE_RE.finditer(text)]
             chunk_size = len(words) // 3
-            chapters = [
-                " ".join(words[i:i+chunk_size]) 
-                for i in range(0, len(words), chunk_size)
-            ]
+            chapters = []
+            for i in range(0, len(words), chunk_size):
+                chunk = words[i:i+chunk_size]
+                chapters.append((" ".join(w[0] for w in chunk), chunk[0][1], chunk[-1][2]))
         
-        return chapters[:5]  # Max 5 chapters
\ No newline at end of file
+        return chapters[:5]  # Max 5 chapters
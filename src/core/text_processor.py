@@ -1,8 +1,198 @@
 # ========== Imports ==========
 import nltk
+from nltk import pos_tag_sents, word_tokenize
+from nltk.corpus import stopwords
+from nltk.tokenize import sent_tokenize
 from collections import Counter
+from functools import lru_cache
+from itertools import chain, repeat
+import operator
 import re
 import string
+import numpy as np
+
+# ========== Compiled Patterns ==========
+# Compiled once when the module is imported instead of on every call
+
+_WORD3_RE = re.compile(r'\b[A-Za-z]{3,}\b')     # Words of 3+ letters
+_WORD4_RE = re.compile(r'\b[A-Za-z]{4,}\b')     # Words of 4+ letters
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')          # Rough sentence boundaries
+_WS_RE = re.compile(r'\s+')                     # Runs of whitespace
+_LETTER_RE = re.compile(r'[A-Za-z]')            # A single ASCII letter
+
+# Every header, list and context pattern below has exactly one capture
+# group, so findall() always returns plain strings (never tuples)
+
+# Different header formats (checked against each stripped line)
+_HEADER_RES = (
+    re.compile(r'^([A-Z][A-Za-z\s]{3,40}):?\s*$'),  # Line starting with capital letter
+    re.compile(r'^\d+\.?\s+([A-Z][A-Za-z\s]{3,40})'),  # Numbered sections like "1. Introduction"
+    re.compile(r'^([A-Z\s]{4,30})$'),  # ALL CAPS headers
+    re.compile(r'^\s*[-=]{3,}\s*([A-Za-z\s]{3,40})\s*[-=]{3,}'),  # Decorated headers with lines
+)
+
+# Bullet points and numbered lists
+_LIST_RES = (
+    re.compile(r'[-*•]\s+([A-Z][A-Za-z\s]{5,40})', re.MULTILINE),  # Bullet points with dashes, stars, bullets
+    re.compile(r'\d+\)\s+([A-Z][A-Za-z\s]{5,40})', re.MULTILINE),  # Numbered lists like "1) Something"
+)
+
+# Context patterns that indicate important concepts (NOT hardcoded topics!)
+_CONTEXT_RES = (
+    re.compile(r'(?:concept of|definition of|meaning of|understanding)\s+([A-Za-z\s]{3,30})', re.IGNORECASE),
+    re.compile(r'([A-Z][A-Za-z\s]{3,30})\s+(?:is|are|means|refers to)', re.IGNORECASE),
+    re.compile(r'(?:introducing|explaining|discussing)\s+([A-Za-z\s]{3,30})', re.IGNORECASE),
+    re.compile(r'([A-Z][A-Za-z\s]{3,30})\s+(?:involves|includes|contains)', re.IGNORECASE),
+)
+
+# Common junk patterns, joined into one regex so a term is matched once
+_JUNK_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'^\d+$',  # Just numbers like "123"
+    r'^[^\w]+$',  # Just symbols like "!!!"
+    r'page\s*\d+',  # Page references like "page 5"
+    r'figure\s*\d+',  # Figure references like "figure 2"
+)))
+
+
+def _count_occurrences(text_lower, needle):
+    """
+    Count where a phrase appears in the text, using one split of the text.
+
+    Gives the same numbers as text_lower.count(needle), text_lower.find(needle)
+    and len([s for s in text_lower.split('.') if needle in s]), without
+    testing every '.'-separated piece. Two neighbouring occurrences are in
+    different pieces exactly when the text between them contains a '.'.
+
+    Args:
+        text_lower (str): Lowercase text to search
+        needle (str): Lowercase phrase to look for (not empty)
+
+    Returns:
+        tuple: (number of occurrences, first position or -1,
+                number of '.'-separated pieces that contain the phrase)
+    """
+    segments = text_lower.split(needle)
+    count = len(segments) - 1
+    if count == 0:
+        return 0, -1, 0
+
+    first_pos = len(segments[0])
+
+    # A phrase with a '.' in it can never sit inside a single piece
+    if '.' in needle:
+        return count, first_pos, 0
+
+    # Count the gaps between occurrences that contain a '.' (done in C by map)
+    pieces = 1 + sum(map(operator.contains, segments[1:-1], repeat('.')))
+    return count, first_pos, pieces
+
+
+# ========== Shared Stopwords ==========
+
+# Enhanced stopwords - add common junk words that aren't meaningful as topics
+_EXTRA_STOPWORDS = frozenset([
+    'it', 'they', 'we', 'that', 'this', 'these', 'those',
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be',
+    'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'should', 'could', 'may',
+    'might', 'must', 'can', 'time', 'need', 'make',
+    'use', 'used', 'using', 'also', 'one', 'two', 'three',
+    'first', 'second', 'third', 'many', 'some', 'more',
+    'most', 'other', 'such', 'no', 'nor', 'not', 'only',
+    'own', 'same', 'so', 'than', 'too', 'very', 'just',
+    'but', 'what', 'which', 'who', 'when', 'where', 'why',
+    'how', 'all', 'each', 'every', 'both', 'few', 'way',
+    'work', 'part', 'take', 'get', 'give', 'made', 'find',
+    'tell', 'ask', 'show', 'try', 'leave', 'call', 'back',
+    'keep', 'let', 'put', 'said', 'know', 'come', 'look',
+    'want', 'seem', 'feel', 'new', 'right', 'good', 'old',
+    'great', 'little', 'own', 'other', 'last', 'long',
+    'small', 'large', 'next', 'early', 'young', 'important',
+    'few', 'public', 'bad', 'same', 'able', 'page', 'pages',
+    'version', 'number', 'numbers', 'chapter', 'section',
+    'figure', 'table', 'see', 'show', 'example', 'examples'
+]) | frozenset(string.ascii_lowercase) | frozenset(str(i) for i in range(100)) | frozenset([
+    # Single letters and numbers (above) and symbols
+    '=', '-', '_', '+', '*', '/', '\\', '|', '&', '%', '$', '#', '@', '!', '?'
+])
+
+
+@lru_cache(maxsize=None)
+def _load_stopwords():
+    """
+    Build the stopword set once per process and share it between instances.
+
+    Downloads the NLTK data the app needs the first time, if it is missing.
+
+    Returns:
+        frozenset: NLTK's English stopwords plus _EXTRA_STOPWORDS
+    """
+    try:
+        words = stopwords.words('english')
+    except LookupError:
+        print("Downloading NLTK data...")
+        nltk.download('stopwords', quiet=True)
+        nltk.download('punkt', quiet=True)
+        nltk.download('averaged_perceptron_tagger', quiet=True)
+        nltk.download('wordnet', quiet=True)
+        nltk.download('punkt_tab', quiet=True)
+        words = stopwords.words('english')
+
+    return frozenset(words) | _EXTRA_STOPWORDS
+
+
+@lru_cache(maxsize=8)
+def _cached_sentences(text):
+    """
+    Split text into sentences once and remember the result.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        tuple: Sentences (a tuple so the cached value can't be changed)
+    """
+    return tuple(sent_tokenize(text))
+
+
+@lru_cache(maxsize=4096)
+def _check_meaningful_topic(term, stopwords):
+    """
+    Run the junk filters of TextProcessor._is_meaningful_topic on one term.
+
+    Args:
+        term (str): Term to evaluate
+        stopwords (frozenset): Words that can't be topics on their own
+
+    Returns:
+        bool: True if term is meaningful, False if it's junk
+    """
+    term = term.strip()
+    term_lower = term.lower()
+    
+    # Basic length filters
+    if len(term) < 3 or len(term) > 60:
+        return False
+    
+    # Check if it's a stopword
+    if term_lower in stopwords:
+        return False
+    
+    # Check if it's mostly symbols or numbers (at least 60% should be letters)
+    if len(_LETTER_RE.findall(term)) < len(term) * 0.6:
+        return False
+    
+    # Check if all words in the term are stopwords
+    words = term_lower.split()
+    if all(word in stopwords for word in words):
+        return False
+    
+    # Avoid common junk patterns (numbers, symbols, page/figure references)
+    if _JUNK_RE.match(term_lower):
+        return False
+    
+    return True
+
 
 class TextProcessor:
     """
@@ -20,49 +210,30 @@ class TextProcessor:
         Downloads required NLTK data if not already present and sets up
         a comprehensive list of stopwords to filter out common words.
         """
-        # Download NLTK data if needed
+        # Shared, read-only stopword set (built and downloaded once per process)
+        self.stopwords = _load_stopwords()
+
+        # Load the Punkt sentence model now (at server startup) instead of on
+        # the first upload, where it would add a noticeable delay
+        self._warm_up_sentence_tokenizer()
+
+    def _warm_up_sentence_tokenizer(self):
+        """
+        Force NLTK to load its Punkt sentence model from disk.
+
+        sent_tokenize() loads the model lazily on its first call. Calling it
+        once here moves that cost to startup. Missing data is downloaded once.
+        """
         try:
-            from nltk.corpus import stopwords
-            from nltk.tokenize import word_tokenize, sent_tokenize
-            self.stopwords = set(stopwords.words('english'))
-        except:
-            print("Downloading NLTK data...")
-            nltk.download('stopwords', quiet=True)
-            nltk.download('punkt', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-            nltk.download('wordnet', quiet=True)
+            sent_tokenize("Warm up.")
+        except LookupError:
+            print("Downloading NLTK sentence tokenizer...")
             nltk.download('punkt_tab', quiet=True)
-            from nltk.corpus import stopwords
-            self.stopwords = set(stopwords.words('english'))
-        
-        # Enhanced stopwords - add common junk words that aren't meaningful as topics
-        self.stopwords.update([
-            'it', 'they', 'we', 'that', 'this', 'these', 'those',
-            'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'should', 'could', 'may',
-            'might', 'must', 'can', 'time', 'need', 'make',
-            'use', 'used', 'using', 'also', 'one', 'two', 'three',
-            'first', 'second', 'third', 'many', 'some', 'more',
-            'most', 'other', 'such', 'no', 'nor', 'not', 'only',
-            'own', 'same', 'so', 'than', 'too', 'very', 'just',
-            'but', 'what', 'which', 'who', 'when', 'where', 'why',
-            'how', 'all', 'each', 'every', 'both', 'few', 'way',
-            'work', 'part', 'take', 'get', 'give', 'made', 'find',
-            'tell', 'ask', 'show', 'try', 'leave', 'call', 'back',
-            'keep', 'let', 'put', 'said', 'know', 'come', 'look',
-            'want', 'seem', 'feel', 'new', 'right', 'good', 'old',
-            'great', 'little', 'own', 'other', 'last', 'long',
-            'small', 'large', 'next', 'early', 'young', 'important',
-            'few', 'public', 'bad', 'same', 'able', 'page', 'pages',
-            'version', 'number', 'numbers', 'chapter', 'section',
-            'figure', 'table', 'see', 'show', 'example', 'examples'
-        ])
-        
-        # Add single letters, numbers, and symbols to stopwords
-        self.stopwords.update(string.ascii_lowercase)
-        self.stopwords.update([str(i) for i in range(100)])
-        self.stopwords.update(['=', '-', '_', '+', '*', '/', '\\', '|', '&', '%', '$', '#', '@', '!', '?'])
+            try:
+                sent_tokenize("Warm up.")
+            except LookupError as e:
+                # Still missing (e.g. offline) - the first upload will report it
+                print(f" Sentence tokenizer not available: {e}")
 
     # ========== Main Topic Extraction Method ==========
 
@@ -85,6 +256,14 @@ class TextProcessor:
         if len(text) < 50:
             return ["General Topic"]
         
+        # Work out the lowercase text, the sentence split and the words of
+        # each sentence once, instead of letting every method (and every
+        # candidate word) redo it
+        text_lower = text.lower()
+        sentences = _SENT_SPLIT_RE.split(text)
+        sentences_lower = [sentence.lower() for sentence in sentences]
+        sentence_words = [_WORD3_RE.findall(sentence) for sentence in sentences_lower]
+
         # Use 5 different extraction methods (NO HARDCODING)
         topics = []
         
@@ -93,11 +272,12 @@ class TextProcessor:
         topics.extend(structure_topics)
         
         # Method 2: Extract high-frequency meaningful terms
-        frequency_topics = self._extract_high_frequency_terms(text)
+        frequency_topics = self._extract_high_frequency_terms(
+            sentences_lower, sentence_words)
         topics.extend(frequency_topics)
         
         # Method 3: Extract capitalized noun sequences (proper nouns)
-        noun_topics = self._extract_capitalized_nouns(text)
+        noun_topics = self._extract_capitalized_nouns(sentences)
         topics.extend(noun_topics)
         
         # Method 4: Extract context-based important terms (definition patterns)
@@ -105,12 +285,12 @@ class TextProcessor:
         topics.extend(context_topics)
         
         # Method 5: Extract semantic clusters (words that appear together)
-        cluster_topics = self._extract_semantic_clusters(text)
+        cluster_topics = self._extract_semantic_clusters(sentence_words)
         topics.extend(cluster_topics)
         
         # Clean up, remove duplicates, and rank by importance
         clean_topics = self._clean_and_filter_topics(topics)
-        ranked_topics = self._rank_by_importance(clean_topics, text)
+        ranked_topics = self._rank_by_importance(clean_topics, text_lower)
         
         print(f" Extracted {len(ranked_topics)} dynamic topics")
         return ranked_topics[:15]  # Return top 15 topics
@@ -135,42 +315,28 @@ class TextProcessor:
         """
         topics = []
         
-        # Pattern 1: Different header formats
-        header_patterns = [
-            r'^([A-Z][A-Za-z\s]{3,40}):?\s*$',  # Line starting with capital letter
-            r'^\d+\.?\s+([A-Z][A-Za-z\s]{3,40})',  # Numbered sections like "1. Introduction"
-            r'^([A-Z\s]{4,30})$',  # ALL CAPS headers
-            r'^\s*[-=]{3,}\s*([A-Za-z\s]{3,40})\s*[-=]{3,}',  # Decorated headers with lines
-        ]
-        
+        # Pattern 1: Different header formats (see _HEADER_RES)
         # Check each line for header patterns
         lines = text.split('\n')
         for line in lines:
             line = line.strip()
-            for pattern in header_patterns:
-                matches = re.findall(pattern, line)
+            for pattern in _HEADER_RES:
+                matches = pattern.findall(line)
                 if matches:
                     for match in matches:
-                        if isinstance(match, tuple):
-                            match = match[0]
                         if self._is_meaningful_topic(match):
                             topics.append(match.strip())
         
-        # Pattern 2: Bullet points and numbered lists
-        list_patterns = [
-            r'[-*•]\s+([A-Z][A-Za-z\s]{5,40})',  # Bullet points with dashes, stars, bullets
-            r'\d+\)\s+([A-Z][A-Za-z\s]{5,40})',  # Numbered lists like "1) Something"
-        ]
-        
-        for pattern in list_patterns:
-            matches = re.findall(pattern, text, re.MULTILINE)
+        # Pattern 2: Bullet points and numbered lists (see _LIST_RES)
+        for pattern in _LIST_RES:
+            matches = pattern.findall(text)
             for match in matches:
                 if self._is_meaningful_topic(match):
                     topics.append(match.strip())
         
         return topics[:20]  # Return maximum 20 structure-based topics
 
-    def _extract_high_frequency_terms(self, text):
+    def _extract_high_frequency_terms(self, sentences_lower, sentence_words):
         """
         Extract high-frequency meaningful terms that appear multiple times.
 
@@ -178,31 +344,45 @@ class TextProcessor:
         important topics. Filters out common words and junk.
 
         Args:
-            text (str): Input text to analyze
+            sentences_lower (list): Sentences of the text, in lowercase
+            sentence_words (list): Words (3+ letters) of each sentence
 
         Returns:
             list: High-frequency meaningful terms
         """
-        # Break text into individual words (3+ characters only)
-        words = re.findall(r'\b[A-Za-z]{3,}\b', text.lower())
-        
-        # Count how often each word appears
-        word_freq = Counter(words)
+        # Count how often each word appears (sentence punctuation is never
+        # part of a word, so these are the same words as in the whole text)
+        word_freq = Counter(chain.from_iterable(sentence_words))
         
-        # Filter for meaningful terms only
-        meaningful_terms = []
-        for word, freq in word_freq.most_common(100):
+        # Cheap checks first: only these words need the meaning check below
+        candidates = [
+            word for word, freq in word_freq.most_common(100)
             if (freq >= 3 and  # Must appear at least 3 times
                 len(word) > 4 and  # Must be at least 5 characters long
                 word not in self.stopwords and  # Can't be a common stopword
-                not word.isdigit() and  # Can't be just a number
-                self._has_meaning_indicators(word, text)):  # Must have semantic meaning
-                
+                not word.isdigit())  # Can't be just a number
+        ]
+        
+        # Inverted index: candidate word -> positions of the sentences that
+        # contain it, built in one pass instead of rescanning every sentence
+        # for every candidate. Membership is whole-word: "neuron" no longer
+        # matches a sentence that only has "neurons" (the older substring
+        # check did, which is why _rank_by_importance still uses substrings)
+        candidate_set = set(candidates)
+        word_sentences = {word: [] for word in candidates}
+        for index, words in enumerate(sentence_words):
+            for word in candidate_set.intersection(words):
+                word_sentences[word].append(index)
+        
+        # Filter for meaningful terms only
+        meaningful_terms = []
+        for word in candidates:
+            if self._has_meaning_indicators(word, sentences_lower, word_sentences[word]):  # Must have semantic meaning
                 meaningful_terms.append(word.title())  # Convert to title case
         
         return meaningful_terms[:15]  # Return top 15 frequent terms
 
-    def _extract_capitalized_nouns(self, text):
+    def _extract_capitalized_nouns(self, sentences):
         """
         Extract capitalized noun sequences using natural language processing.
 
@@ -210,26 +390,26 @@ class TextProcessor:
         in the text, which often represent important topics.
 
         Args:
-            text (str): Input text to analyze
+            sentences (list): Input text split on sentence punctuation
 
         Returns:
             list: Capitalized noun phrases found in text
         """
         try:
-            from nltk import pos_tag, word_tokenize
-            
             # Process first 30 sentences (for performance)
-            sentences = re.split(r'[.!?]+', text)[:30]
             capitalized_terms = []
             
-            for sentence in sentences:
-                if len(sentence.strip()) < 10:
-                    continue
-                
-                # Break sentence into words and tag parts of speech
-                words = word_tokenize(sentence)
-                tagged = pos_tag(words)
-                
+            # Break each sentence into words. The sentences are already split,
+            # so preserve_line=True skips word_tokenize's own sentence pass
+            tokenized = [
+                word_tokenize(sentence, preserve_line=True)
+                for sentence in sentences[:30]
+                if len(sentence.strip()) >= 10
+            ]
+            
+            # Tag parts of speech for all sentences in one batch call
+            # instead of one pos_tag() call per sentence
+            for tagged in pos_tag_sents(tokenized):
                 # Find sequences of capitalized nouns
                 current_sequence = []
                 for word, tag in tagged:
@@ -270,28 +450,18 @@ class TextProcessor:
         """
         context_terms = []
         
-        # Context patterns that indicate important concepts (NOT hardcoded topics!)
-        context_indicators = [
-            r'(?:concept of|definition of|meaning of|understanding)\s+([A-Za-z\s]{3,30})',
-            r'([A-Z][A-Za-z\s]{3,30})\s+(?:is|are|means|refers to)',
-            r'(?:introducing|explaining|discussing)\s+([A-Za-z\s]{3,30})',
-            r'([A-Z][A-Za-z\s]{3,30})\s+(?:involves|includes|contains)',
-        ]
-        
-        # Search for each pattern in the text
-        for pattern in context_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        # Search for each context pattern (see _CONTEXT_RES) in the text
+        for pattern in _CONTEXT_RES:
+            matches = pattern.findall(text)
             for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
                 # Clean up extra spaces
-                cleaned_match = re.sub(r'\s+', ' ', match.strip())
+                cleaned_match = _WS_RE.sub(' ', match.strip())
                 if self._is_meaningful_topic(cleaned_match):
                     context_terms.append(cleaned_match.title())
         
         return context_terms[:10]  # Return maximum 10 context-based terms
 
-    def _extract_semantic_clusters(self, text):
+    def _extract_semantic_clusters(self, sentence_words):
         """
         Extract terms that appear in similar contexts (semantic clustering).
 
@@ -299,43 +469,51 @@ class TextProcessor:
         which suggests they are related to important topics.
 
         Args:
-            text (str): Input text to analyze
+            sentence_words (list): Words (3+ letters, lowercase) of each sentence
 
         Returns:
             list: Terms that appear in rich semantic contexts
         """
-        # Split text into sentences for context analysis
-        sentences = re.split(r'[.!?]+', text)
-        
-        # Track what words appear near each other
-        word_contexts = {}
-        
-        for sentence in sentences:
-            # Find meaningful words in this sentence
-            words = re.findall(r'\b[A-Za-z]{4,}\b', sentence.lower())
-            words = [w for w in words if w not in self.stopwords and len(w) > 4]
-            
-            # Record context for each word (what words appear near it)
-            for i, word in enumerate(words):
-                if word not in word_contexts:
-                    word_contexts[word] = []
-                
-                # Add surrounding words as context (2 words before and after)
-                context_start = max(0, i-2)
-                context_end = min(len(words), i+3)
-                context = words[context_start:context_end]
-                word_contexts[word].extend([w for w in context if w != word])
-        
-        # Find words that appear in diverse, rich contexts
-        semantic_terms = []
-        for word, contexts in word_contexts.items():
-            if len(set(contexts)) >= 5:  # Appears with many different words
-                context_freq = Counter(contexts)
-                # If word has strong semantic associations
-                if len(context_freq) >= 3:
-                    semantic_terms.append(word.title())
-        
-        return semantic_terms[:10]  # Return maximum 10 semantic terms
+        # Give every meaningful word a number (in order of first appearance)
+        # and write the whole text down as one flat list of word numbers,
+        # remembering which sentence each word came from
+        vocab = {}
+        token_ids = []
+        sentence_ids = []
+        for sentence_id, words in enumerate(sentence_words):
+            for word in words:
+                if word not in self.stopwords and len(word) > 4:
+                    token_ids.append(vocab.setdefault(word, len(vocab)))
+                    sentence_ids.append(sentence_id)
+
+        if not vocab:
+            return []
+
+        ids = np.array(token_ids, dtype=np.int64)
+        sentence_ids = np.array(sentence_ids, dtype=np.int64)
+        vocab_size = len(vocab)
+
+        # A word's context is the words up to 2 places before and after it in
+        # the same sentence (other than itself). Collect every (word, context
+        # word) pair with NumPy instead of growing a Python list per word.
+        pairs = []
+        for distance in (1, 2):
+            same = ((sentence_ids[distance:] == sentence_ids[:-distance]) &
+                    (ids[distance:] != ids[:-distance]))
+            left = ids[:-distance][same]
+            right = ids[distance:][same]
+            pairs.append(left * vocab_size + right)
+            pairs.append(right * vocab_size + left)
+
+        # Count how many different context words each word has
+        distinct_pairs = np.unique(np.concatenate(pairs))
+        context_counts = np.bincount(distinct_pairs // vocab_size, minlength=vocab_size)
+
+        # Find words that appear in diverse, rich contexts (with many different words)
+        words = list(vocab)
+        semantic_terms = [words[i].title() for i in np.flatnonzero(context_counts >= 5)[:10]]
+
+        return semantic_terms  # Return maximum 10 semantic terms
 
     # ========== Helper Methods for Filtering and Validation ==========
 
@@ -355,40 +533,11 @@ class TextProcessor:
         if not term or not isinstance(term, str):
             return False
         
-        term = term.strip()
-        term_lower = term.lower()
-        
-        # Basic length filters
-        if len(term) < 3 or len(term) > 60:
-            return False
-        
-        # Check if it's a stopword
-        if term_lower in self.stopwords:
-            return False
-        
-        # Check if it's mostly symbols or numbers (at least 60% should be letters)
-        if len(re.findall(r'[A-Za-z]', term)) < len(term) * 0.6:
-            return False
-        
-        # Check if all words in the term are stopwords
-        words = term_lower.split()
-        if all(word in self.stopwords for word in words):
-            return False
-        
-        # Avoid common junk patterns
-        junk_patterns = [
-            r'^\d+$',  # Just numbers like "123"
-            r'^[^\w]+$',  # Just symbols like "!!!"
-            r'page\s*\d+',  # Page references like "page 5"
-            r'figure\s*\d+',  # Figure references like "figure 2"
-        ]
-        
-        if any(re.match(pattern, term_lower) for pattern in junk_patterns):
-            return False
-        
-        return True
+        # The same candidate strings come up again and again (from several
+        # extractors, and across uploads), so the checks are cached per string
+        return _check_meaningful_topic(term, self.stopwords)
 
-    def _has_meaning_indicators(self, word, text):
+    def _has_meaning_indicators(self, word, sentences_lower, sentence_indexes):
         """
         Check if a word has semantic meaning in the text context.
 
@@ -397,22 +546,32 @@ class TextProcessor:
 
         Args:
             word (str): Word to check for meaning
-            text (str): Full text for context analysis
+            sentences_lower (list): Sentences of the text, in lowercase
+            sentence_indexes (list): Positions in sentences_lower of the
+                sentences that contain the word (from the inverted index)
 
         Returns:
             bool: True if word has semantic meaning, False otherwise
         """
         word_lower = word.lower()
-        text_lower = text.lower()
         
-        # Find sentences that contain this word
-        sentences_with_word = [s for s in text_lower.split('.') if word_lower in s]
+        # Look up the sentences that contain this word
+        sentences_with_word = [sentences_lower[i] for i in sentence_indexes]
         
         # Word must appear in at least 2 different contexts
         if len(sentences_with_word) < 2:
             return False
         
-        # Check if word appears in definition-like contexts
+        # Check if word has rich semantic associations (either this or a
+        # definition context below is enough)
+        word_sentences = [s for s in sentences_with_word if len(s.split()) > 5]
+        if len(word_sentences) >= 2:
+            return True
+        
+        # Check if word appears in definition-like contexts, searching only
+        # the sentences that contain the word as a whole word. This is not
+        # the same as the old whole-text search: a context in a sentence that
+        # only has a longer form of the word ("neurons are") no longer counts
         definition_contexts = [
             f'{word_lower} is',
             f'{word_lower} are',
@@ -422,13 +581,13 @@ class TextProcessor:
             f'understanding {word_lower}',
         ]
         
-        has_definition_context = any(context in text_lower for context in definition_contexts)
-        
-        # Check if word has rich semantic associations
-        word_sentences = [s for s in sentences_with_word if len(s.split()) > 5]
-        has_rich_context = len(word_sentences) >= 2
+        has_definition_context = any(
+            context in sentence
+            for sentence in sentences_with_word
+            for context in definition_contexts
+        )
         
-        return has_definition_context or has_rich_context
+        return has_definition_context
 
     def _clean_and_filter_topics(self, topics):
         """
@@ -452,7 +611,7 @@ class TextProcessor:
                 continue
             
             # Normalize whitespace and capitalization
-            topic = re.sub(r'\s+', ' ', topic).strip()
+            topic = _WS_RE.sub(' ', topic).strip()
             topic = topic.title()
             topic_lower = topic.lower()
             
@@ -467,7 +626,7 @@ class TextProcessor:
 
     # ========== Topic Ranking and Scoring ==========
 
-    def _rank_by_importance(self, topics, text):
+    def _rank_by_importance(self, topics, text_lower):
         """
         Rank topics by importance using multiple scoring factors.
 
@@ -476,7 +635,7 @@ class TextProcessor:
 
         Args:
             topics (list): List of cleaned topics to rank
-            text (str): Original text for scoring analysis
+            text_lower (str): Original text for scoring analysis, in lowercase
 
         Returns:
             list: Topics ranked by importance (most important first)
@@ -484,22 +643,20 @@ class TextProcessor:
         if not topics:
             return []
         
-        text_lower = text.lower()
         scored_topics = []
         
         for topic in topics:
             topic_lower = topic.lower()
             
-            # Factor 1: Frequency in text (how often topic appears)
-            frequency = text_lower.count(topic_lower)
+            # Factor 1: Frequency in text (how often topic appears), along with
+            # its first position and how many sentences mention it (one split)
+            frequency, first_pos, sentence_count = _count_occurrences(text_lower, topic_lower)
             
             # Factor 2: Position score (earlier appearance = more important)
-            first_pos = text_lower.find(topic_lower)
             position_score = 1000 / (first_pos + 1) if first_pos >= 0 else 0
             
             # Factor 3: Context richness (how many sentences mention this topic)
-            sentences_with_topic = [s for s in text_lower.split('.') if topic_lower in s]
-            context_score = len(sentences_with_topic) * 10
+            context_score = sentence_count * 10
             
             # Factor 4: Multi-word bonus (phrases are often more specific/important)
             word_count_bonus = len(topic.split()) * 50
@@ -537,13 +694,28 @@ class TextProcessor:
             list: List of (keyword, frequency) tuples
         """
         # Find all words of 4+ characters
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
+        words = _WORD4_RE.findall(text.lower())
         # Filter out stopwords
         filtered = [w for w in words if w not in self.stopwords]
         # Count frequency and return top results
         freq = Counter(filtered)
         return freq.most_common(top_n)
 
+    def segment(self, text):
+        """
+        Split text into sentences, reusing the result for the same text.
+
+        The processing pipeline calls this once per upload and passes the
+        sentences to every generator, so the text is only tokenized once.
+
+        Args:
+            text (str): Text to split
+
+        Returns:
+            list: List of sentences
+        """
+        return list(_cached_sentences(text))
+
     def split_into_sentences(self, text):
         """
         Split text into individual sentences using NLTK.
@@ -554,5 +726,4 @@ class TextProcessor:
         Returns:
             list: List of sentences
         """
-        from nltk.tokenize import sent_tokenize
-        return sent_tokenize(text)
\ No newline at end of file
+        return self.segment(text)
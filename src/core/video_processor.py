@@ -1,12 +1,296 @@
 # ========== Imports ==========
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import speech_recognition as sr
+from moviepy.config import get_setting
 from moviepy.editor import VideoFileClip
 from pydub import AudioSegment
 from pydub.silence import split_on_silence
+from pydub.utils import db_to_float, ratio_to_db
 from pathlib import Path
 import json
+import math
 from datetime import timedelta
+import numpy as np
+
+# numba is optional - it compiles the silence scan below into one fused
+# machine-code loop (without it the NumPy version is used)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson is optional - it turns Python objects into JSON much faster
+# than the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Chunks sent to Google's speech API at the same time. Each request mostly
+# waits on the network, so overlapping them cuts the total wait
+RECOGNITION_WORKERS = 10
+
+# ========== Silence Detection ==========
+
+# NumPy types for the sample widths the fast silence scan understands
+# (other widths fall back to pydub's own split_on_silence)
+_SAMPLE_DTYPES = {1: np.int8, 2: np.dtype('<i2')}
+
+# Squared samples are summed this many milliseconds at a time, so long
+# lectures never need one huge temporary array
+_ENERGY_BLOCK_MS = 10_000
+
+
+def _energy_prefix(audio, samples):
+    """
+    Add up the squared samples of the audio, one total per millisecond mark.
+
+    Args:
+        audio (AudioSegment): The audio being scanned
+        samples (np.ndarray): audio.raw_data viewed as signed samples
+
+    Returns:
+        tuple: (prefix, bounds, total) where prefix[i] is the sum of squared
+               samples before millisecond i, bounds[i] is the sample index
+               where pydub's audio[i:] would start and total is the sum of
+               squared samples over the whole audio
+    """
+    seg_len = len(audio)
+
+    # Same millisecond -> frame rounding as AudioSegment slicing
+    frames = (np.arange(seg_len + 1) * (audio.frame_rate / 1000.0)).astype(np.int64)
+    bounds = frames * audio.channels
+    available = np.minimum(bounds, len(samples))
+
+    prefix = np.empty(seg_len + 1, dtype=np.int64)
+    total = 0
+    for first in range(0, seg_len, _ENERGY_BLOCK_MS):
+        # Millisecond marks in this block, plus the first mark of the next
+        marks = available[first:first + _ENERGY_BLOCK_MS + 1]
+        block = samples[marks[0]:marks[-1]].astype(np.int64)
+
+        running = np.zeros(len(block) + 1, dtype=np.int64)
+        np.cumsum(block * block, out=running[1:])
+
+        prefix[first:first + len(marks)] = total + running[marks - marks[0]]
+        total += int(running[-1])
+
+    # Samples after the last millisecond mark (less than 1 ms)
+    tail = samples[available[-1]:].astype(np.int64)
+    total += int(np.dot(tail, tail))
+
+    return prefix, bounds, total
+
+
+def _dbfs_from_energy(audio, total, sample_count):
+    """
+    Loudness of the whole audio, the same value as AudioSegment.dBFS.
+
+    Args:
+        audio (AudioSegment): The audio being scanned
+        total (int): Sum of squared samples over the whole audio
+        sample_count (int): Number of samples in the audio
+
+    Returns:
+        float: Loudness in dBFS (-inf for digital silence)
+    """
+    # Truncated to an integer like audioop.rms
+    rms = int(math.sqrt(total / sample_count)) if sample_count else 0
+    if not rms:
+        return -float("inf")
+    return ratio_to_db(rms / audio.max_possible_amplitude)
+
+
+def _detect_silence(audio, min_silence_len, silence_thresh, seek_step, below_average=None):
+    """
+    Find silent ranges exactly like pydub.silence.detect_silence.
+
+    pydub slices the audio and calls audioop.rms once per seek step, which
+    is a Python loop over every millisecond. Here every window's energy
+    comes from one prefix-sum array, so all windows are checked at once.
+
+    Args:
+        audio (AudioSegment): The audio to scan
+        min_silence_len (int): Minimum silence length (ms)
+        silence_thresh (float): Silence threshold (dBFS)
+        seek_step (int): Step between checked windows (ms)
+        below_average (float, optional): If given, use a threshold this many
+            dB below the audio's own loudness instead of silence_thresh
+
+    Returns:
+        list: [start, end] silent ranges in milliseconds
+    """
+    seg_len = len(audio)
+    if seg_len < min_silence_len:
+        return []
+
+    samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+    prefix, bounds, total = _energy_prefix(audio, samples)
+
+    # The whole-audio loudness comes from the same pass over the samples,
+    # so audio.dBFS doesn't have to read the audio again
+    if below_average is not None:
+        silence_thresh = _dbfs_from_energy(audio, total, len(samples)) - below_average
+
+    # Every window start pydub would check (always including the last one)
+    last_slice_start = seg_len - min_silence_len
+    starts = np.arange(0, last_slice_start + 1, seek_step)
+    if last_slice_start % seek_step:
+        starts = np.append(starts, last_slice_start)
+
+    threshold = db_to_float(silence_thresh) * audio.max_possible_amplitude
+    ranges = _scan_silent_ranges(prefix, bounds, starts, min_silence_len, seek_step, threshold)
+
+    return [[int(start), int(end)] for start, end in ranges]
+
+
+def _scan_silent_ranges_numpy(prefix, bounds, starts, min_silence_len, seek_step, threshold):
+    """
+    Check every window for silence and join the silent ones into ranges.
+
+    Args:
+        prefix (np.ndarray): Running sum of squared samples per millisecond
+        bounds (np.ndarray): Sample index where each millisecond starts
+        starts (np.ndarray): Window starts to check (ms)
+        min_silence_len (int): Window length (ms)
+        seek_step (int): Step between window starts (ms)
+        threshold (float): Largest RMS that still counts as silence
+
+    Returns:
+        np.ndarray: (start, end) silent ranges in milliseconds, one per row
+    """
+    ends = starts + min_silence_len
+
+    # RMS of each window, truncated to an integer like audioop.rms (windows
+    # that run past the data are padded with silence, so count every sample)
+    energy = prefix[ends] - prefix[starts]
+    count = bounds[ends] - bounds[starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rms = np.where(count > 0, np.floor(np.sqrt(energy / count)), 0)
+
+    silence_starts = starts[rms <= threshold]
+    if silence_starts.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Join neighbouring silent windows into ranges (same rule as pydub:
+    # a new range starts only after a gap longer than one window)
+    previous = silence_starts[:-1]
+    current = silence_starts[1:]
+    new_range = (current != previous + seek_step) & (current > previous + min_silence_len)
+
+    range_starts = np.concatenate(([silence_starts[0]], current[new_range]))
+    range_ends = np.concatenate((previous[new_range], [silence_starts[-1]])) + min_silence_len
+
+    return np.column_stack((range_starts, range_ends))
+
+
+def _scan_silent_ranges_loop(prefix, bounds, starts, min_silence_len, seek_step, threshold):
+    """
+    Same as _scan_silent_ranges_numpy, written as one loop for numba.
+
+    Computing the RMS, comparing it with the threshold and joining the
+    ranges in a single pass avoids the temporary arrays of the NumPy
+    version. Only used when numba is installed (as plain Python it would
+    be slow).
+    """
+    ranges = np.empty((len(starts), 2), dtype=np.int64)
+    range_count = 0
+    in_silence = False
+    range_start = 0
+    previous = 0
+
+    for k in range(len(starts)):
+        start = starts[k]
+        end = start + min_silence_len
+
+        # RMS of the window, truncated to an integer like audioop.rms
+        count = bounds[end] - bounds[start]
+        rms = 0.0
+        if count > 0:
+            rms = math.floor(math.sqrt((prefix[end] - prefix[start]) / count))
+
+        if rms <= threshold:
+            if not in_silence:
+                range_start = start
+                in_silence = True
+            elif start != previous + seek_step and start > previous + min_silence_len:
+                ranges[range_count, 0] = range_start
+                ranges[range_count, 1] = previous + min_silence_len
+                range_count += 1
+                range_start = start
+            previous = start
+
+    if in_silence:
+        ranges[range_count, 0] = range_start
+        ranges[range_count, 1] = previous + min_silence_len
+        range_count += 1
+
+    return ranges[:range_count]
+
+
+# Use the compiled loop when numba is available, else the NumPy version
+if njit is not None:
+    _scan_silent_ranges = njit(cache=True)(_scan_silent_ranges_loop)
+else:
+    _scan_silent_ranges = _scan_silent_ranges_numpy
+
+
+def _fast_split_on_silence(audio, min_silence_len=1000, silence_thresh=-16,
+                           keep_silence=100, seek_step=1, below_average=None):
+    """
+    Split audio on silence, giving the same chunks as pydub's split_on_silence.
+
+    Args:
+        audio (AudioSegment): The audio to split
+        min_silence_len (int): Minimum silence length (ms)
+        silence_thresh (float): Silence threshold (dBFS)
+        keep_silence (int or bool): Silence to keep at chunk edges (ms)
+        seek_step (int): Step between checked windows (ms)
+        below_average (float, optional): If given, use a threshold this many
+            dB below the audio's own loudness (audio.dBFS) instead of
+            silence_thresh
+
+    Returns:
+        list: AudioSegment chunks
+    """
+    if audio.sample_width not in _SAMPLE_DTYPES:
+        if below_average is not None:
+            silence_thresh = audio.dBFS - below_average
+        return split_on_silence(audio, min_silence_len, silence_thresh, keep_silence, seek_step)
+
+    seg_len = len(audio)
+    if isinstance(keep_silence, bool):
+        keep_silence = seg_len if keep_silence else 0
+
+    # Turn the silent ranges into the sound ranges between them
+    silent_ranges = _detect_silence(audio, min_silence_len, silence_thresh, seek_step, below_average)
+    if not silent_ranges:
+        nonsilent_ranges = [[0, seg_len]]
+    elif silent_ranges[0] == [0, seg_len]:
+        nonsilent_ranges = []
+    else:
+        nonsilent_ranges = []
+        prev_end = 0
+        for start, end in silent_ranges:
+            nonsilent_ranges.append([prev_end, start])
+            prev_end = end
+        if prev_end != seg_len:
+            nonsilent_ranges.append([prev_end, seg_len])
+        if nonsilent_ranges[0] == [0, 0]:
+            nonsilent_ranges.pop(0)
+
+    # Pad each chunk with some silence, splitting it evenly where the
+    # padding of two neighbouring chunks would overlap
+    output_ranges = [[start - keep_silence, end + keep_silence] for start, end in nonsilent_ranges]
+    for current, following in zip(output_ranges, output_ranges[1:]):
+        if following[0] < current[1]:
+            current[1] = (current[1] + following[0]) // 2
+            following[0] = current[1]
+
+    return [audio[max(start, 0):min(end, seg_len)] for start, end in output_ranges]
+
 
 class VideoProcessor:
     """
@@ -22,11 +306,25 @@ class VideoProcessor:
     - Return structured transcript with timestamps
     """
 
-    def __init__(self):
+    def __init__(self, max_chunks=None):
+        """
+        Set up the speech recognizer.
+
+        Args:
+            max_chunks (int, optional): Only transcribe this many audio chunks
+                per video, at least 1 (None transcribes the whole video)
+        """
+        if max_chunks is not None and max_chunks < 1:
+            raise ValueError(f"max_chunks must be at least 1 (or None), got {max_chunks}")
+
         # Initialize speech recognizer from Google
         self.recognizer = sr.Recognizer()
         # List of video formats we can process
         self.supported_formats = ['mp4', 'avi', 'mov', 'mkv', 'webm']
+        # The same formats as file endings, for a single endswith() check
+        self._supported_endings = tuple(f'.{ext}' for ext in self.supported_formats)
+        # Optional limit on how many chunks are transcribed
+        self.max_chunks = max_chunks
 
     # ========== Main Video Processing Method ==========
 
@@ -65,8 +363,9 @@ class VideoProcessor:
         """
         Extract audio track from video file.
 
-        Uses moviepy to separate the audio from video and save it as a WAV file
-        that can be processed by speech recognition.
+        Runs ffmpeg directly to copy just the audio track into a WAV file
+        that can be processed by speech recognition. Going through moviepy
+        would also open the video stream and pass all audio through Python.
 
         Args:
             video_path (Path): Path to the video file
@@ -77,18 +376,26 @@ class VideoProcessor:
         try:
             print(" Extracting audio from video...")
 
-            # Load the video file using moviepy
-            video = VideoFileClip(str(video_path))
-
             # Create path for the audio file (same name as video but .wav)
             audio_path = video_path.parent / f"{video_path.stem}_audio.wav"
 
-            # Extract audio and save as WAV file
-            # logger=None prevents moviepy from showing progress messages
-            video.audio.write_audiofile(str(audio_path), logger=None)
-
-            # Close video file to free up memory
-            video.close()
+            # Decode only the audio track (-vn skips the video) to 16 kHz mono
+            # 16-bit PCM - all speech recognition needs, and a much smaller file
+            # than 44.1 kHz stereo. Uses the same ffmpeg binary as moviepy.
+            command = [
+                get_setting("FFMPEG_BINARY"),
+                "-y",                    # Overwrite an old audio file
+                "-loglevel", "error",    # Only print real problems
+                "-i", str(video_path),
+                "-vn",                   # No video
+                "-ac", "1",              # Mono
+                "-ar", "16000",          # 16 kHz sample rate
+                "-acodec", "pcm_s16le",  # 16-bit WAV samples
+                str(audio_path),
+            ]
+            result = subprocess.run(command, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise Exception(result.stderr.strip() or f"ffmpeg exited with code {result.returncode}")
 
             print(f" Audio extracted: {audio_path.name}")
             return audio_path
@@ -117,12 +424,20 @@ class VideoProcessor:
             # Load the audio file using pydub
             audio = AudioSegment.from_wav(str(audio_path))
 
+            # Speech recognition only needs 16 kHz mono 16-bit audio. Audio
+            # from _extract_audio is already in this format (these calls then
+            # do nothing); anything else shrinks before the silence scan and
+            # the upload to Google
+            audio = audio.set_channels(1).set_frame_rate(16000).set_sample_width(2)
+
             # Split audio into chunks based on silence
             # This helps improve recognition accuracy
-            chunks = split_on_silence(
+            # (NumPy scan that matches pydub's split_on_silence but doesn't
+            # loop over the audio in Python)
+            chunks = _fast_split_on_silence(
                 audio,
                 min_silence_len=500,      # Minimum silence length (ms)
-                silence_thresh=audio.dBFS - 14,  # Silence threshold
+                below_average=14,         # Silence threshold: 14 dB below average loudness
                 keep_silence=250         # Keep some silence at chunk edges
             )
 
@@ -137,35 +452,33 @@ class VideoProcessor:
             timestamps = []
             current_time = 0
 
-            # Limit to 20 chunks to prevent very long processing times
-            for i, chunk in enumerate(chunks[:20]):
+            # Transcribe every chunk unless a limit was configured
+            selected_chunks = chunks
+            if self.max_chunks is not None and len(chunks) > self.max_chunks:
+                selected_chunks = chunks[:self.max_chunks]
+                print(f"⚠ Transcript truncated: only the first {self.max_chunks} of {len(chunks)} chunks are transcribed")
+
+            # Send the chunks to the speech API in parallel (with at least one
+            # thread, a pool can't start with none). Each future keeps its
+            # chunk's result or error until it is collected below.
+            with ThreadPoolExecutor(max_workers=max(1, min(RECOGNITION_WORKERS, len(selected_chunks)))) as pool:
+                futures = [pool.submit(self._recognize_chunk, chunk) for chunk in selected_chunks]
+
+            # Collect the results in chunk order so the timestamps line up
+            for i, (chunk, future) in enumerate(zip(selected_chunks, futures)):
                 try:
-                    # Create temporary file for this audio chunk
-                    chunk_path = audio_path.parent / f"chunk_{i}.wav"
-                    chunk.export(str(chunk_path), format="wav")
-
-                    # Use speech recognition on this chunk
-                    with sr.AudioFile(str(chunk_path)) as source:
-                        # Load the audio data
-                        audio_data = self.recognizer.record(source)
-                        # Convert speech to text using Google's API
-                        text = self.recognizer.recognize_google(audio_data)
-
-                        if text:  # If we got some text from this chunk
-                            full_text.append(text)
-                            timestamps.append({
-                                'start': str(timedelta(milliseconds=current_time)),
-                                'end': str(timedelta(milliseconds=current_time + len(chunk))),
-                                'text': text
-                            })
-
-                    # Delete the temporary chunk file
-                    chunk_path.unlink()
-
-                    # Update current time position
-                    current_time += len(chunk)
+                    text = future.result()
+
+                    if text:  # If we got some text from this chunk
+                        full_text.append(text)
+                        # Plain millisecond numbers (no string formatting per chunk)
+                        timestamps.append({
+                            'start_ms': current_time,
+                            'end_ms': current_time + len(chunk),
+                            'text': text
+                        })
 
-                    print(f" Chunk {i+1}/{min(len(chunks), 20)} transcribed")
+                    print(f" Chunk {i+1}/{len(selected_chunks)} transcribed")
 
                 except sr.UnknownValueError:
                     # Speech recognition couldn't understand this chunk
@@ -176,23 +489,49 @@ class VideoProcessor:
                 except Exception as e:
                     # Any other error processing this chunk
                     print(f"⚠ Error processing chunk {i+1}: {e}")
+                finally:
+                    # Update current time position (also for chunks that
+                    # failed, so the later timestamps stay in place)
+                    current_time += len(chunk)
 
             # Combine all transcribed text into one string
             combined_text = " ".join(full_text)
 
-            print(f" Transcription complete: {len(combined_text.split())} words")
+            word_count = len(combined_text.split())
+
+            print(f" Transcription complete: {word_count} words")
 
             # Return structured transcript data
             return {
                 'full_text': combined_text,
                 'timestamps': timestamps,
-                'word_count': len(combined_text.split()),
-                'duration': str(timedelta(milliseconds=current_time))
+                'word_count': word_count,
+                'duration': str(timedelta(milliseconds=len(audio)))  # Whole audio, not just the transcribed chunks
             }
 
         except Exception as e:
             raise Exception(f"Error transcribing audio: {str(e)}")
 
+    def _recognize_chunk(self, chunk):
+        """
+        Convert one audio chunk to text with Google's speech recognition.
+
+        Runs on a worker thread, so it only reads shared state.
+
+        Args:
+            chunk (AudioSegment): Piece of the audio to transcribe
+
+        Returns:
+            str: Recognized text (raises sr.UnknownValueError if none)
+        """
+        # Hand the chunk's samples (already 16 kHz mono 16-bit, see
+        # _transcribe_audio) to speech recognition directly, without a
+        # temporary WAV file
+        audio_data = sr.AudioData(chunk.raw_data, chunk.frame_rate, chunk.sample_width)
+
+        # Convert speech to text using Google's API
+        return self.recognizer.recognize_google(audio_data)
+
     # ========== File Saving ==========
 
     def save_transcript(self, transcript, output_path):
@@ -211,9 +550,12 @@ class VideoProcessor:
         # Make sure the output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save transcript as formatted JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, indent=2, ensure_ascii=False)
+        # Save transcript as formatted JSON (UTF-8, not \u escapes)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(transcript, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(transcript, f, indent=2, ensure_ascii=False)
 
         print(f" Transcript saved: {output_path.name}")
 
@@ -257,8 +599,4 @@ class VideoProcessor:
         Returns:
             bool: True if format is supported, False otherwise
         """
-        if '.' not in filename:
-            return False
-
-        extension = filename.rsplit('.', 1)[1].lower()
-        return extension in self.supported_formats
\ No newline at end of file
+        return filename.lower().endswith(self._supported_endings)
\ No newline at end of file
@@ -1,8 +1,104 @@
 # ========== Imports ==========
+import json
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+# ========== Helpers ==========
+
+def _decode_key_points(stored):
+    """
+    Turn the stored key_points column back into a list of strings.
+
+    New rows hold a JSON array. Rows saved by older versions joined the
+    key points with '|||', so anything that isn't a JSON array is split
+    the old way.
+
+    Args:
+        stored (str or None): Value of the key_points column
+
+    Returns:
+        list: Key points
+    """
+    if not stored:
+        return []
+    if stored.startswith('['):
+        try:
+            key_points = json.loads(stored)
+        except ValueError:
+            pass
+        else:
+            if isinstance(key_points, list):
+                return key_points
+    return stored.split('|||')
+
+
+# ========== Connection Pool ==========
+
+class ConnectionPool:
+    """
+    A small thread-safe pool of SQLite connections.
+
+    Connections are created lazily (only when needed) up to ``size`` and
+    handed out through a queue, so each connection is only used by one
+    thread at a time. If the process forks (for example gunicorn workers
+    started with preload_app), the pool starts over with new connections,
+    because SQLite connections must not be shared between processes.
+    """
+
+    def __init__(self, connect, size):
+        """
+        Create an empty connection pool.
+
+        Args:
+            connect (callable): Function that opens a new connection
+            size (int): Maximum number of connections in the pool
+        """
+        self._connect = connect
+        self.size = max(1, size)
+        self._reset()
+
+    def _reset(self):
+        """Forget all connections and start with an empty pool."""
+        self._pool = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection from the pool and give it back afterwards.
+
+        Waits for a free connection if all of them are in use.
+
+        Yields:
+            sqlite3.Connection: Connection reserved for the caller
+        """
+        # Connections from the parent process can't be used after a fork
+        if os.getpid() != self._pid:
+            self._reset()
+
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    conn = self._connect()
+            if conn is None:
+                conn = self._pool.get()
+
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
 class Database:
     """
     Handle all database operations for the AI Study Material Generator.
@@ -14,12 +110,13 @@ class Database:
     - Providing search functionality
     """
 
-    def __init__(self, db_path):
+    def __init__(self, db_path, readers=None):
         """
         Initialize the database connection and create required tables.
 
         Args:
             db_path (str or Path): Path to the SQLite database file
+            readers (int, optional): Number of read connections (defaults to CPU count)
         """
         self.db_path = Path(db_path)
         # Create parent directories if they don't exist
@@ -27,8 +124,78 @@ class Database:
         # Initialize database with all required tables
         self._init_database()
 
+        # With WAL, readers never block each other or the writer, so reads
+        # get several connections while all writes go through a single one
+        self.read_pool = ConnectionPool(
+            lambda: self._connect(read_only=True),
+            readers or os.cpu_count() or 2
+        )
+        self.write_pool = ConnectionPool(self._connect, 1)
+
     # ========== Database Initialization ==========
 
+    def _connect(self, read_only=False):
+        """
+        Open a new SQLite connection with tuned settings.
+
+        Every connection gets the same PRAGMAs:
+        - synchronous=NORMAL: fewer disk syncs per commit (safe with WAL)
+        - busy_timeout: wait up to 5 seconds for a lock instead of failing
+        - cache_size: keep about 20MB of pages in memory
+        - temp_store=MEMORY: build temporary tables and indexes in memory
+        - foreign_keys=ON: enforce the ON DELETE CASCADE rules
+        - query_only (read connections): refuse any accidental writes
+
+        Args:
+            read_only (bool): Open a connection for the read pool
+
+        Returns:
+            sqlite3.Connection: Open database connection
+        """
+        # Pooled connections are handed between threads, one at a time
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA cache_size = -20000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if read_only:
+            conn.execute("PRAGMA query_only = 1")
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """
+        Borrow a read-only connection from the read pool.
+
+        Yields:
+            sqlite3.Connection: Read-only connection
+        """
+        with self.read_pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def _writer(self):
+        """
+        Borrow the writer connection and run the block in one transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so the transaction
+        never has to be retried halfway through. Changes are committed when
+        the block finishes, or rolled back if it raises an error.
+
+        Yields:
+            sqlite3.Connection: Connection inside an open transaction
+        """
+        with self.write_pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
     def _init_database(self):
         """
         Initialize database with all required tables.
@@ -38,10 +205,19 @@ class Database:
         - flashcards: Store generated question-answer pairs
         - summaries: Store text summaries and key points
         - topics: Store extracted topics for each material
+
+        Also switches the database to WAL journal mode so readers don't
+        block while an upload is being written (the setting is saved in
+        the database file, so it only needs to be done once).
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
+        # WAL mode lets reads run while a write is in progress
+        # (not available for in-memory databases)
+        if str(self.db_path) != ':memory:':
+            cursor.execute("PRAGMA journal_mode = WAL")
+
         # Materials table - stores basic file information
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS materials (
@@ -91,13 +267,24 @@ class Database:
             )
         """)
 
+        # Indexes so looking up data for one material doesn't scan the whole table
+        # (topic search uses LIKE '%term%', which can't use an index, so
+        # topic_name is left without one)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_flashcards_material ON flashcards(material_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_summaries_material ON summaries(material_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_topics_material ON topics(material_id)")
+
+        # Newest-first listings (ORDER BY upload_date DESC LIMIT ?) can read
+        # the first rows of this index instead of sorting every material
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_materials_upload_date ON materials(upload_date)")
+
         # Save changes and close connection
         conn.commit()
         conn.close()
 
     # ========== Save Operations ==========
 
-    def save_material(self, filename, file_type, file_size):
+    def save_material(self, filename, file_type, file_size, status='processed'):
         """
         Save basic information about an uploaded file.
 
@@ -105,23 +292,22 @@ class Database:
             filename (str): Name of the uploaded file
             file_type (str): Type/extension of the file (pdf, txt, docx, etc.)
             file_size (int): Size of the file in bytes
+            status (str): Processing status ('processing', 'processed' or 'failed')
 
         Returns:
             int: The ID of the newly created material record
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Insert new material record with current timestamp
-        cursor.execute("""
-            INSERT INTO materials (filename, file_type, file_size, upload_date)
-            VALUES (?, ?, ?, ?)
-        """, (filename, file_type, file_size, datetime.now()))
+            # Insert new material record with current timestamp
+            cursor.execute("""
+                INSERT INTO materials (filename, file_type, file_size, upload_date, status)
+                VALUES (?, ?, ?, ?, ?)
+            """, (filename, file_type, file_size, datetime.now(), status))
 
-        # Get the ID of the newly inserted material
-        material_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            # Get the ID of the newly inserted material
+            material_id = cursor.lastrowid
 
         return material_id
 
@@ -133,25 +319,24 @@ class Database:
             material_id (int): ID of the material these flashcards belong to
             flashcards (list): List of flashcard dictionaries with question/answer pairs
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Insert each flashcard into the database
-        for card in flashcards:
-            cursor.execute("""
+            # Insert all flashcards in one batch (single transaction)
+            cursor.executemany("""
                 INSERT INTO flashcards (material_id, question, answer, topic, difficulty, card_type)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                material_id,
-                card['question'],
-                card['answer'],
-                card.get('topic', 'General'),        # Default topic if not specified
-                card.get('difficulty', 'medium'),    # Default difficulty if not specified
-                card.get('type', 'general')          # Default type if not specified
-            ))
-
-        conn.commit()
-        conn.close()
+            """, [
+                (
+                    material_id,
+                    card['question'],
+                    card['answer'],
+                    card.get('topic', 'General'),        # Default topic if not specified
+                    card.get('difficulty', 'medium'),    # Default difficulty if not specified
+                    card.get('type', 'general')          # Default type if not specified
+                )
+                for card in flashcards
+            ])
 
     def save_summary(self, material_id, summary_data):
         """
@@ -161,24 +346,22 @@ class Database:
             material_id (int): ID of the material this summary belongs to
             summary_data (dict): Dictionary containing summary text, key points, etc.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Convert key points list to a string (using ||| as separator)
-        key_points_str = '|||'.join(summary_data.get('key_points', []))
+            # Store the key points list as a JSON array (works for any text,
+            # and SQLite's json_* functions can read it)
+            key_points_str = json.dumps(summary_data.get('key_points', []), ensure_ascii=False)
 
-        cursor.execute("""
-            INSERT INTO summaries (material_id, summary_text, key_points, compression_ratio)
-            VALUES (?, ?, ?, ?)
-        """, (
-            material_id,
-            summary_data['summary'],
-            key_points_str,
-            summary_data.get('compression_ratio', 0.0)
-        ))
-
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+                INSERT INTO summaries (material_id, summary_text, key_points, compression_ratio)
+                VALUES (?, ?, ?, ?)
+            """, (
+                material_id,
+                summary_data['summary'],
+                key_points_str,
+                summary_data.get('compression_ratio', 0.0)
+            ))
 
     def save_topics(self, material_id, topics):
         """
@@ -188,18 +371,44 @@ class Database:
             material_id (int): ID of the material these topics belong to
             topics (list): List of topic strings extracted from the material
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Insert each topic with frequency 1 (can be enhanced later)
-        for topic in topics:
-            cursor.execute("""
+            # Insert all topics in one batch with frequency 1 (can be enhanced later)
+            cursor.executemany("""
                 INSERT INTO topics (material_id, topic_name, frequency)
                 VALUES (?, ?, ?)
-            """, (material_id, topic, 1))
+            """, [(material_id, topic, 1) for topic in topics])
 
-        conn.commit()
-        conn.close()
+    def update_material_status(self, material_id, status):
+        """
+        Update the processing status of a material.
+
+        Args:
+            material_id (int): ID of the material to update
+            status (str): New status ('processing', 'processed' or 'failed')
+        """
+        with self._writer() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("UPDATE materials SET status = ? WHERE id = ?", (status, material_id))
+
+    def fail_interrupted_materials(self):
+        """
+        Mark materials left in 'processing' by a previous run as 'failed'.
+
+        Background jobs live only as long as the server process, so a
+        material still marked 'processing' at startup will never finish.
+        Call this once when the app starts, before any new job is queued.
+
+        Returns:
+            int: Number of materials that were marked as failed
+        """
+        with self._writer() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("UPDATE materials SET status = 'failed' WHERE status = 'processing'")
+            return cursor.rowcount
 
     # ========== Retrieve Operations ==========
 
@@ -210,25 +419,54 @@ class Database:
         Returns:
             list: List of material dictionaries with flashcard and summary counts
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # Join materials with flashcards and summaries to get counts
-        cursor.execute("""
-            SELECT m.*, 
-                   COUNT(DISTINCT f.id) as flashcard_count,
-                   COUNT(DISTINCT s.id) as summary_count
-            FROM materials m
-            LEFT JOIN flashcards f ON m.id = f.material_id
-            LEFT JOIN summaries s ON m.id = s.material_id
-            GROUP BY m.id
-            ORDER BY m.upload_date DESC
-        """)
+            # Count related rows per material with the material_id indexes
+            # (joining both tables first would build every flashcard x
+            # summary combination and then de-duplicate it with DISTINCT)
+            cursor.execute("""
+                SELECT m.*,
+                       (SELECT COUNT(*) FROM flashcards f WHERE f.material_id = m.id) as flashcard_count,
+                       (SELECT COUNT(*) FROM summaries s WHERE s.material_id = m.id) as summary_count
+                FROM materials m
+                ORDER BY m.upload_date DESC
+            """)
 
-        # Convert rows to dictionaries
-        materials = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+            # Convert rows to dictionaries
+            materials = [dict(row) for row in cursor.fetchall()]
+
+        return materials
+
+    def get_materials_page(self, limit, offset=0):
+        """
+        Get one page of materials with their statistics, newest first.
+
+        Only the requested rows are loaded, so the cost depends on the
+        page size instead of the total number of materials.
+
+        Args:
+            limit (int): Maximum number of materials to return
+            offset (int): Number of materials to skip
+
+        Returns:
+            list: List of material dictionaries with flashcard and summary counts
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            # Walk the primary key backwards and count related rows per
+            # material (the counts use the material_id indexes)
+            cursor.execute("""
+                SELECT m.*,
+                       (SELECT COUNT(*) FROM flashcards f WHERE f.material_id = m.id) as flashcard_count,
+                       (SELECT COUNT(*) FROM summaries s WHERE s.material_id = m.id) as summary_count
+                FROM materials m
+                ORDER BY m.id DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+
+            materials = [dict(row) for row in cursor.fetchall()]
 
         return materials
 
@@ -242,14 +480,11 @@ class Database:
         Returns:
             dict or None: Material information dictionary or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM materials WHERE id = ?", (material_id,))
-        material = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        conn.close()
+            cursor.execute("SELECT * FROM materials WHERE id = ?", (material_id,))
+            material = cursor.fetchone()
         return dict(material) if material else None
 
     def get_flashcards_by_material(self, material_id):
@@ -262,15 +497,33 @@ class Database:
         Returns:
             list: List of flashcard dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return list(self.iter_flashcards_by_material(material_id))
 
-        cursor.execute("SELECT * FROM flashcards WHERE material_id = ?", (material_id,))
-        flashcards = [dict(row) for row in cursor.fetchall()]
+    def iter_flashcards_by_material(self, material_id, batch_size=256):
+        """
+        Yield the flashcards for a specific material a batch at a time.
 
-        conn.close()
-        return flashcards
+        Only batch_size rows are loaded at once, so callers that stop early
+        or stream the cards never hold the whole result in memory. A read
+        connection is borrowed until the generator finishes or is closed.
+
+        Args:
+            material_id (int): ID of the material
+            batch_size (int): Rows fetched from SQLite per batch
+
+        Yields:
+            dict: One flashcard at a time
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT * FROM flashcards WHERE material_id = ?", (material_id,))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
 
     def get_summary_by_material(self, material_id):
         """
@@ -282,19 +535,15 @@ class Database:
         Returns:
             dict or None: Summary dictionary with key_points as a list, or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM summaries WHERE material_id = ?", (material_id,))
-        summary = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        conn.close()
+            cursor.execute("SELECT * FROM summaries WHERE material_id = ?", (material_id,))
+            summary = cursor.fetchone()
 
         if summary:
             summary_dict = dict(summary)
-            # Convert key points string back to list (split by |||)
-            summary_dict['key_points'] = summary_dict['key_points'].split('|||')
+            summary_dict['key_points'] = _decode_key_points(summary_dict['key_points'])
             return summary_dict
 
         return None
@@ -309,14 +558,11 @@ class Database:
         Returns:
             list: List of topic dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM topics WHERE material_id = ?", (material_id,))
-        topics = [dict(row) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        conn.close()
+            cursor.execute("SELECT * FROM topics WHERE material_id = ?", (material_id,))
+            topics = [dict(row) for row in cursor.fetchall()]
         return topics
 
     # ========== Delete Operations ==========
@@ -331,14 +577,11 @@ class Database:
         Args:
             material_id (int): ID of the material to delete
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Delete material (CASCADE will handle related data)
-        cursor.execute("DELETE FROM materials WHERE id = ?", (material_id,))
-
-        conn.commit()
-        conn.close()
+            # Delete material (CASCADE will handle related data)
+            cursor.execute("DELETE FROM materials WHERE id = ?", (material_id,))
 
     # ========== Search Operations ==========
 
@@ -352,25 +595,43 @@ class Database:
         Returns:
             list: List of material dictionaries that contain the topic
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # Search for materials that have topics containing the search term
-        cursor.execute("""
-            SELECT DISTINCT m.*
-            FROM materials m
-            JOIN topics t ON m.id = t.material_id
-            WHERE t.topic_name LIKE ?
-        """, (f"%{topic_name}%",))
+            # Search for materials that have topics containing the search term
+            cursor.execute("""
+                SELECT DISTINCT m.*
+                FROM materials m
+                JOIN topics t ON m.id = t.material_id
+                WHERE t.topic_name LIKE ?
+            """, (f"%{topic_name}%",))
 
-        materials = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+            materials = [dict(row) for row in cursor.fetchall()]
 
         return materials
 
     # ========== Additional Utility Methods ==========
 
+    def get_change_token(self):
+        """
+        Get a value that changes whenever the database is written to.
+
+        Uses the modification time and size of the database file and its
+        WAL file, so it also notices writes made by other worker processes.
+        Callers can compare tokens to know if cached results are still valid.
+
+        Returns:
+            tuple: Opaque token, equal between calls only if nothing changed
+        """
+        token = []
+        for path in (self.db_path, Path(f"{self.db_path}-wal")):
+            try:
+                info = os.stat(path)
+                token.append((info.st_mtime_ns, info.st_size))
+            except OSError:
+                token.append(None)
+        return tuple(token)
+
     def get_database_stats(self):
         """
         Get overall statistics about the database.
@@ -378,27 +639,50 @@ class Database:
         Returns:
             dict: Dictionary containing counts of materials, flashcards, summaries, and topics
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Count records in each table
-        stats = {}
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM materials")
-        stats['total_materials'] = cursor.fetchone()[0]
+            # Count records in each table
+            stats = {}
 
-        cursor.execute("SELECT COUNT(*) FROM flashcards")
-        stats['total_flashcards'] = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM materials")
+            stats['total_materials'] = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(*) FROM summaries")
-        stats['total_summaries'] = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM flashcards")
+            stats['total_flashcards'] = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(*) FROM topics")
-        stats['total_topics'] = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM summaries")
+            stats['total_summaries'] = cursor.fetchone()[0]
 
-        conn.close()
+            cursor.execute("SELECT COUNT(*) FROM topics")
+            stats['total_topics'] = cursor.fetchone()[0]
         return stats
 
+    def get_stats_totals(self):
+        """
+        Count materials, flashcards and summaries in a single query.
+
+        Flashcards and summaries only count when their material still
+        exists, matching the per-material counts of get_all_materials().
+
+        Returns:
+            tuple: (total_materials, total_flashcards, total_summaries)
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM materials),
+                    (SELECT COUNT(*) FROM flashcards
+                     WHERE material_id IN (SELECT id FROM materials)),
+                    (SELECT COUNT(*) FROM summaries
+                     WHERE material_id IN (SELECT id FROM materials))
+            """)
+            totals = tuple(cursor.fetchone())
+
+        return totals
+
     def get_recent_materials(self, limit=10):
         """
         Get the most recently uploaded materials.
@@ -409,18 +693,16 @@ class Database:
         Returns:
             list: List of recent material dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT * FROM materials 
-            ORDER BY upload_date DESC 
-            LIMIT ?
-        """, (limit,))
+            cursor.execute("""
+                SELECT * FROM materials 
+                ORDER BY upload_date DESC 
+                LIMIT ?
+            """, (limit,))
 
-        materials = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+            materials = [dict(row) for row in cursor.fetchall()]
 
         return materials
 
@@ -430,26 +712,23 @@ class Database:
         
         This is a maintenance function to ensure data integrity.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._writer() as conn:
+            cursor = conn.cursor()
 
-        # Clean up orphaned flashcards
-        cursor.execute("""
-            DELETE FROM flashcards 
-            WHERE material_id NOT IN (SELECT id FROM materials)
-        """)
-
-        # Clean up orphaned summaries
-        cursor.execute("""
-            DELETE FROM summaries 
-            WHERE material_id NOT IN (SELECT id FROM materials)
-        """)
+            # Clean up orphaned flashcards
+            cursor.execute("""
+                DELETE FROM flashcards 
+                WHERE material_id NOT IN (SELECT id FROM materials)
+            """)
 
-        # Clean up orphaned topics
-        cursor.execute("""
-            DELETE FROM topics 
-            WHERE material_id NOT IN (SELECT id FROM materials)
-        """)
+            # Clean up orphaned summaries
+            cursor.execute("""
+                DELETE FROM summaries 
+                WHERE material_id NOT IN (SELECT id FROM materials)
+            """)
 
-        conn.commit()
-        conn.close()
\ No newline at end of file
+            # Clean up orphaned topics
+            cursor.execute("""
+                DELETE FROM topics 
+                WHERE material_id NOT IN (SELECT id FROM materials)
+            """)
@@ -1,9 +1,32 @@
 # ========== Imports ==========
 import json
 import csv
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
+# orjson is optional - it reads and writes JSON faster than the standard
+# json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson options matching json.dump(indent=2): pretty printed, and also
+# accepting non-string keys and NumPy values. The compact options are the
+# same without the indentation
+if orjson is not None:
+    _ORJSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | _ORJSON_COMPACT_OPTIONS
+
+# How many files export_all_data reads at the same time
+_EXPORT_READ_WORKERS = 8
+
 class FileManager:
     """
     Manage file operations for saving and loading output files.
@@ -13,23 +36,50 @@ class FileManager:
     - Summaries (JSON)
     - Concept maps (JSON)
     - Learning paths (JSON)
+
+    Files people are expected to open and read (flashcards, summaries) are
+    pretty printed. Files mostly read by other programs (concept maps for
+    the D3 graph, learning paths, backups) are saved as compact JSON by
+    default, which is smaller and faster to write and parse. Pass
+    pretty=True to those save methods to get an indented file instead.
     """
 
-    def __init__(self, output_folder):
+    # Output folders whose subfolders were already created in this process
+    # (shared by all instances, so new instances skip the mkdir calls)
+    _ensured_folders = set()
+
+    def __init__(self, output_folder, json_cache_size=64):
         """
         Initialize the FileManager with output folder structure.
 
         Args:
             output_folder (str or Path): Main folder where all outputs will be saved
+            json_cache_size (int): How many parsed JSON files load_json_cached keeps
         """
         self.output_folder = Path(output_folder)
+
+        # Parsed JSON files, most recently used last ((path, mtime) -> data)
+        self._json_cache = OrderedDict()
+        self._json_cache_size = json_cache_size
+        self._json_cache_lock = threading.Lock()
+
+        # Last JSON file listing per folder (folder -> (folder mtime, names))
+        self._listing_cache = {}
         
         # Create subfolders for different types of outputs
         self.flashcards_folder = self.output_folder / 'flashcards'
         self.summaries_folder = self.output_folder / 'summaries'
         self.concept_maps_folder = self.output_folder / 'concept_maps'
         self.learning_paths_folder = self.output_folder / 'learning_paths'
-        
+
+        # Map folder types to actual folder paths
+        self._folder_map = {
+            'flashcards': self.flashcards_folder,
+            'summaries': self.summaries_folder,
+            'concept_maps': self.concept_maps_folder,
+            'learning_paths': self.learning_paths_folder
+        }
+
         # Create all folders if they don't exist
         self._create_folders()
 
@@ -42,6 +92,10 @@ class FileManager:
         Makes sure we have folders for flashcards, summaries, concept maps,
         and learning paths before we try to save files.
         """
+        # Nothing to do if another instance already created them
+        if self.output_folder in FileManager._ensured_folders:
+            return
+
         folders = [
             self.flashcards_folder,
             self.summaries_folder,
@@ -49,9 +103,89 @@ class FileManager:
             self.learning_paths_folder
         ]
 
+        # Create the main output folder (and any parent folders) once...
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+
+        # ...so each subfolder is a single mkdir without walking the parents
         for folder in folders:
-            # Create folder and any parent folders if needed
-            folder.mkdir(parents=True, exist_ok=True)
+            folder.mkdir(exist_ok=True)
+
+        FileManager._ensured_folders.add(self.output_folder)
+
+    @contextmanager
+    def _atomic_open(self, filepath, newline=None, binary=False):
+        """
+        Open a file for writing so that readers never see it half-written.
+
+        Everything is written to a temporary file in the same folder, which
+        is flushed to disk and then renamed over the real file in one step.
+        A download running at the same time gets either the old file or the
+        new one. If writing fails, the old file is left untouched.
+
+        Args:
+            filepath (str or Path): Final path of the file
+            newline (str, optional): Passed to open() (the CSV writer needs '')
+            binary (bool): Open the file in binary mode instead of text mode
+
+        Yields:
+            file: File to write to
+        """
+        filepath = Path(filepath)
+        fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix='.tmp')
+        try:
+            if binary:
+                f = os.fdopen(fd, 'wb')
+            else:
+                f = os.fdopen(fd, 'w', encoding='utf-8', newline=newline)
+            with f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates private files, use normal file permissions instead
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, filepath)
+            # The folder's file list may have changed
+            self._listing_cache.pop(filepath.parent, None)
+        except BaseException:
+            # Remove the temporary file if anything went wrong
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_json(self, filepath, data, pretty=True):
+        """
+        Save data as a UTF-8 JSON file.
+
+        Uses orjson when it is installed and the standard json module
+        otherwise. Either way the whole file is encoded first and written
+        with a single write call, and the file is replaced atomically.
+
+        Args:
+            filepath (str or Path): Where to save the file
+            data: JSON-compatible data to save
+            pretty (bool): Indent the JSON (True) or write it compactly (False)
+        """
+        with self._atomic_open(filepath, binary=True) as f:
+            f.write(self._dump_json_bytes(data, pretty))
+
+    def _dump_json_bytes(self, data, pretty=True):
+        """
+        Convert data to UTF-8 JSON bytes.
+
+        Args:
+            data: JSON-compatible data
+            pretty (bool): Indent the JSON (True) or make it compact (False)
+
+        Returns:
+            bytes: The same JSON text _write_json would save for the data
+        """
+        if orjson is not None:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS if pretty else _ORJSON_COMPACT_OPTIONS)
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
     # ========== Flashcard Saving Methods ==========
 
@@ -71,16 +205,29 @@ class FileManager:
         """
         filepath = self.flashcards_folder / f"{filename}.json"
 
-        # Create structured data with metadata
-        data = {
-            'generated_at': datetime.now().isoformat(),
-            'total_cards': len(flashcards),
-            'flashcards': flashcards
-        }
-
-        # Save as formatted JSON file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write the metadata and then the cards one at a time, so only one
+        # card's JSON is in memory at once instead of the whole deck's.
+        # The file is the same as saving the full dictionary with indent=2.
+        with self._atomic_open(filepath, binary=True) as f:
+            f.write(b'{\n  "generated_at": ')
+            f.write(self._dump_json_bytes(datetime.now().isoformat()))
+            f.write(b',\n  "total_cards": %d' % len(flashcards))
+            f.write(b',\n  "flashcards": ')
+
+            if not flashcards:
+                f.write(b'[]')
+            else:
+                f.write(b'[\n')
+                for i, card in enumerate(flashcards):
+                    if i:
+                        f.write(b',\n')
+                    # Indent the card's lines to sit inside the list
+                    # (newlines inside strings are escaped, so every raw
+                    # newline is a line break of the layout)
+                    f.write(b'    ' + self._dump_json_bytes(card).replace(b'\n', b'\n    '))
+                f.write(b'\n  ]')
+
+            f.write(b'\n}')
 
         return str(filepath)
 
@@ -103,17 +250,16 @@ class FileManager:
         # Define the columns we want in the CSV
         fieldnames = ['id', 'question', 'answer', 'topic', 'difficulty', 'type']
 
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            
+        with self._atomic_open(filepath, newline='') as f:
+            writer = csv.writer(f)
+
             # Write column headers
-            writer.writeheader()
+            writer.writerow(fieldnames)
 
-            # Write each flashcard as a row
-            for card in flashcards:
-                # Create row with all required fields (empty string if missing)
-                row = {key: card.get(key, '') for key in fieldnames}
-                writer.writerow(row)
+            # Write all flashcards in one writerows call (the loop runs in C).
+            # Each row lists the fields in column order (empty string if
+            # missing) and is built only when it is written.
+            writer.writerows([card.get(key, '') for key in fieldnames] for card in flashcards)
 
         return str(filepath)
 
@@ -148,14 +294,13 @@ class FileManager:
         }
 
         # Save as formatted JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._write_json(filepath, data)
 
         return str(filepath)
 
     # ========== Concept Map Saving Methods ==========
 
-    def save_concept_map_json(self, concept_map, filename):
+    def save_concept_map_json(self, concept_map, filename, pretty=False):
         """
         Save concept map data as JSON for visualization tools.
 
@@ -165,6 +310,7 @@ class FileManager:
         Args:
             concept_map (dict): Graph structure with nodes and edges
             filename (str): Name for the output file (without extension)
+            pretty (bool): Indent the JSON (default: compact)
 
         Returns:
             str: Full path to the saved file
@@ -177,15 +323,14 @@ class FileManager:
             'graph': concept_map
         }
 
-        # Save as formatted JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save as JSON (compact unless asked to be pretty)
+        self._write_json(filepath, data, pretty)
 
         return str(filepath)
 
     # ========== Learning Path Saving Methods ==========
 
-    def save_learning_path_json(self, learning_path, filename):
+    def save_learning_path_json(self, learning_path, filename, pretty=False):
         """
         Save learning path data as JSON for study planning.
 
@@ -195,6 +340,7 @@ class FileManager:
         Args:
             learning_path (dict): Learning path with steps and metadata
             filename (str): Name for the output file (without extension)
+            pretty (bool): Indent the JSON (default: compact)
 
         Returns:
             str: Full path to the saved file
@@ -207,9 +353,8 @@ class FileManager:
             'learning_path': learning_path
         }
 
-        # Save as formatted JSON
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save as JSON (compact unless asked to be pretty)
+        self._write_json(filepath, data, pretty)
 
         return str(filepath)
 
@@ -227,8 +372,46 @@ class FileManager:
         Returns:
             dict or list: Parsed JSON data
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # Both parsers read UTF-8 bytes directly, without a text decoding step
+        raw = Path(filepath).read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    def load_json_cached(self, filepath):
+        """
+        Load a JSON file, reusing the parsed data while the file is unchanged.
+
+        The cache key includes the file's modification time, so rewriting
+        the file automatically makes the old entry stale. Only the most
+        recently used files are kept. The returned data is shared between
+        callers, so it should not be modified.
+
+        Args:
+            filepath (str or Path): Path to the JSON file to load
+
+        Returns:
+            dict or list: Parsed JSON data
+        """
+        filepath = Path(filepath)
+        key = (str(filepath), filepath.stat().st_mtime_ns)
+
+        with self._json_cache_lock:
+            if key in self._json_cache:
+                self._json_cache.move_to_end(key)
+                return self._json_cache[key]
+
+        # Read and parse outside the lock so other requests aren't blocked
+        data = self.load_json(filepath)
+
+        with self._json_cache_lock:
+            self._json_cache[key] = data
+            self._json_cache.move_to_end(key)
+            # Drop the least recently used files when the cache is full
+            while len(self._json_cache) > self._json_cache_size:
+                self._json_cache.popitem(last=False)
+
+        return data
 
     # ========== File Management Utilities ==========
 
@@ -246,22 +429,30 @@ class FileManager:
         Returns:
             list: List of filenames in the specified folder
         """
-        # Map folder types to actual folder paths
-        folder_map = {
-            'flashcards': self.flashcards_folder,
-            'summaries': self.summaries_folder,
-            'concept_maps': self.concept_maps_folder,
-            'learning_paths': self.learning_paths_folder
-        }
-
         # Get the requested folder (default to flashcards)
-        folder = folder_map.get(folder_type, self.flashcards_folder)
-        
-        # Find all JSON files in the folder
-        files = list(folder.glob('*.json'))
-
-        # Return just the filenames (not full paths)
-        return [f.name for f in files]
+        folder = self._folder_map.get(folder_type, self.flashcards_folder)
+
+        # Reuse the last listing while the folder is unchanged (adding,
+        # removing or renaming a file updates the folder's modification time)
+        mtime = folder.stat().st_mtime_ns
+        cached = self._listing_cache.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        # Find all JSON files in the folder (just the filenames, not full
+        # paths). os.scandir gives the names directly, without building a
+        # Path for every file. Hidden files are skipped, as glob('*.json') did
+        with os.scandir(folder) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith('.json')
+                and not entry.name.startswith('.')
+                and entry.is_file()
+            ]
+        self._listing_cache[folder] = (mtime, names)
+
+        # Return a copy so callers can't change the cached list
+        return list(names)
 
     # ========== Additional Utility Methods ==========
 
@@ -299,52 +490,117 @@ class FileManager:
         for folder in [self.flashcards_folder, self.summaries_folder, 
                       self.concept_maps_folder, self.learning_paths_folder]:
             
-            for file_path in folder.glob('*'):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()  # Delete the file
-                    deleted_count += 1
+            # os.scandir gives cheap directory entries that reuse the file
+            # info from the directory listing instead of one Path and two
+            # stat calls per file
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # Skip hidden files (like in-progress temp files), as glob('*') did
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)  # Delete the file
+                        deleted_count += 1
         
         return deleted_count
 
-    def export_all_data(self, export_path):
+    def export_all_data(self, export_path, pretty=False):
         """
         Export all saved data to a single backup file.
 
         Args:
             export_path (str or Path): Where to save the backup file
+            pretty (bool): Indent the backup's JSON (default: compact)
 
         Returns:
             str: Path to the created backup file
         """
         export_path = Path(export_path)
+
+        # The saved files already are JSON, so their bytes are copied into
+        # the backup as they are instead of being parsed and re-encoded.
+        # The layout matches json.dump(indent=2) (or the compact
+        # json.dumps separators) apart from the copied files' own
+        # formatting. A few files are read ahead in background threads so
+        # their disk reads overlap (only those few are in memory at a time).
+
+        # Line breaks with indentation for each nesting level, and the
+        # separator between keys and values
+        if pretty:
+            line, line1, line2, line3, colon = b'\n', b'\n  ', b'\n    ', b'\n      ', b': '
+        else:
+            line = line1 = line2 = line3 = b''
+            colon = b':'
+
+        with self._atomic_open(export_path, binary=True) as out, \
+                ThreadPoolExecutor(max_workers=_EXPORT_READ_WORKERS) as pool:
+            out.write(b'{' + line1 + b'"export_date"' + colon + json.dumps(datetime.now().isoformat()).encode('utf-8'))
+
+            for folder_type, folder_path in self._folder_map.items():
+                out.write(b',' + line1 + f'"{folder_type}"'.encode('utf-8') + colon + b'[')
+                copied = 0
+
+                filenames = self.get_file_list(folder_type)
+                reads = self._read_ahead(pool, [folder_path / filename for filename in filenames])
+
+                for filename, read in zip(filenames, reads):
+                    try:
+                        raw = read.result()
+                    except Exception as e:
+                        print(f"Failed to load {filename}: {e}")
+                        continue
+
+                    out.write((b',' if copied else b'') + line2 + b'{')
+                    out.write(line3 + b'"filename"' + colon + json.dumps(filename, ensure_ascii=False).encode('utf-8'))
+                    out.write(b',' + line3 + b'"data"' + colon + raw + line2 + b'}')
+                    copied += 1
+
+                out.write(line1 + b']' if copied else b']')
+
+            out.write(line + b'}')
         
-        # Collect all data from all folders
-        all_data = {
-            'export_date': datetime.now().isoformat(),
-            'flashcards': [],
-            'summaries': [],
-            'concept_maps': [],
-            'learning_paths': []
-        }
-        
-        # Load all files from each folder
-        for folder_type in ['flashcards', 'summaries', 'concept_maps', 'learning_paths']:
-            files = self.get_file_list(folder_type)
-            folder_path = getattr(self, f"{folder_type}_folder")
-            
-            for filename in files:
-                file_path = folder_path / filename
-                try:
-                    data = self.load_json(file_path)
-                    all_data[folder_type].append({
-                        'filename': filename,
-                        'data': data
-                    })
-                except Exception as e:
-                    print(f"Failed to load {filename}: {e}")
-        
-        # Save backup file
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
-        
-        return str(export_path)
\ No newline at end of file
+        return str(export_path)
+
+    def _read_ahead(self, pool, paths):
+        """
+        Read JSON files in a thread pool, keeping a few reads running ahead.
+
+        Args:
+            pool (ThreadPoolExecutor): Pool that reads the files
+            paths (list): Paths of the JSON files, in the order they are needed
+
+        Yields:
+            Future: One per path (in the same order), resolving to the file's
+            stripped bytes, or raising if the file can't be read or isn't
+            valid JSON
+        """
+        pending = deque()
+        for path in paths:
+            pending.append(pool.submit(self._read_valid_json, path))
+            if len(pending) > _EXPORT_READ_WORKERS:
+                yield pending.popleft()
+
+        while pending:
+            yield pending.popleft()
+
+    @staticmethod
+    def _read_valid_json(path):
+        """
+        Read a JSON file's bytes, making sure they are valid JSON.
+
+        Only valid JSON is copied into a backup, so one broken file can't
+        break the whole backup (checking is cheap, re-encoding was the slow
+        part).
+
+        Args:
+            path (Path): JSON file to read
+
+        Returns:
+            bytes: The file's contents without surrounding whitespace
+        """
+        raw = path.read_bytes().strip()
+        if orjson is not None:
+            orjson.loads(raw)
+        else:
+            json.loads(raw)
+        return raw
\ No newline at end of file
@@ -29,8 +29,12 @@ class Config:
     UPLOAD_FOLDER = BASE_DIR / 'uploads'
     # Maximum file size allowed (100MB for videos, PDFs, etc.)
     MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', 100 * 1024 * 1024))
+    # Uploads are read and written in chunks of this size (1MB)
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
     # File types that users can upload
     ALLOWED_EXTENSIONS = {'pdf', 'txt', 'docx', 'mp4', 'avi', 'mov', 'mkv', 'webm'}
+    # The same extensions as filename endings, for quick upload checks
+    ALLOWED_SUFFIXES = tuple('.' + extension for extension in ALLOWED_EXTENSIONS)
     
     # ========== Output Folder Settings ==========
     # Main folder where all generated study materials are saved
@@ -54,6 +58,21 @@ class Config:
     # How much to compress text when making summaries (0.3 = 30% of original length)
     SUMMARY_RATIO = 0.3
     
+    # ========== Background Processing Settings ==========
+    # Number of uploads that can be processed at the same time, per server
+    # process (gunicorn_conf.py splits the cores between its workers)
+    PROCESSING_WORKERS = int(os.getenv('PROCESSING_WORKERS', os.cpu_count() or 2))
+    # Processes used to extract text from large PDFs, per server process (1 turns it off)
+    PDF_PARSE_WORKERS = int(os.getenv('PDF_PARSE_WORKERS', os.cpu_count() or 1))
+    # PDFs with fewer pages than this are read in a single process
+    PDF_PARALLEL_MIN_PAGES = 20
+
+    # ========== Pagination Settings ==========
+    # How many materials the dashboard and /api/materials return per page
+    MATERIALS_PAGE_SIZE = 50
+    # Largest page size a client can ask for with ?limit=
+    MATERIALS_MAX_PAGE_SIZE = 200
+
     # ========== Video Processing Settings ==========
     # How long each audio chunk should be when processing videos (in seconds)
     VIDEO_CHUNK_DURATION = 60
@@ -61,6 +80,10 @@ class Config:
     AUDIO_SAMPLE_RATE = 16000
     # Language setting for speech-to-text conversion
     SPEECH_RECOGNITION_LANGUAGE = 'en-US'
+    # Most audio chunks to transcribe per video (unset = the whole video)
+    VIDEO_MAX_CHUNKS = int(os.environ['VIDEO_MAX_CHUNKS']) if os.getenv('VIDEO_MAX_CHUNKS') else None
+    if VIDEO_MAX_CHUNKS is not None and VIDEO_MAX_CHUNKS < 1:
+        raise ValueError(f"VIDEO_MAX_CHUNKS must be at least 1 (or unset), got {VIDEO_MAX_CHUNKS}")
     
     # ========== Folder Creation Method ==========
     @classmethod
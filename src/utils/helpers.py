@@ -1,9 +1,28 @@
 # ========== Imports ==========
+import itertools
 import os
 import re
-from datetime import datetime
+import time
 from werkzeug.utils import secure_filename
 
+# ========== Precompiled Patterns ==========
+# Compiled once here instead of being looked up in re's cache on every call
+
+# Anything except letters, numbers, spaces and basic punctuation
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\,\?\!]')
+
+# The same removal for plain ASCII text as a str.translate table, which
+# runs without the regex engine (deletes every ASCII character that
+# _SPECIAL_CHARS_RE would remove)
+_ASCII_SPECIAL_CHARS_TABLE = str.maketrans({
+    c: None for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '_.,?!')
+})
+
+# ========== Unique ID Counter ==========
+# Added to every generated ID so two IDs made in the same clock tick differ
+_ID_COUNTER = itertools.count()
+
 class Helpers:
     """
     Common utility functions for the AI Study Material Generator.
@@ -28,7 +47,9 @@ class Helpers:
 
         Args:
             filename (str): Name of the file to check
-            allowed_extensions (set): Set of allowed file extensions (like {'pdf', 'txt'})
+            allowed_extensions (set, tuple or list): Allowed file extensions,
+                with or without the dot (like {'pdf', 'txt'} or
+                Config.ALLOWED_SUFFIXES)
 
         Returns:
             bool: True if file is allowed, False if not allowed
@@ -39,9 +60,15 @@ class Helpers:
             >>> Helpers.allowed_file('virus.exe', {'pdf', 'txt'})
             False
         """
-        # Check if filename has a dot (indicating an extension)
-        return '.' in filename and \
-               filename.rsplit('.', 1)[1].lower() in allowed_extensions
+        # endswith() needs a tuple of suffixes ('.pdf', ...), so add the
+        # dot where it is missing (whatever kind of collection was passed)
+        suffixes = tuple(
+            extension.lower() if extension.startswith('.') else '.' + extension.lower()
+            for extension in allowed_extensions
+        )
+
+        # Check the end of the filename against every allowed extension at once
+        return filename.lower().endswith(suffixes)
 
     # ========== Filename Security Methods ==========
 
@@ -64,20 +91,21 @@ class Helpers:
             'My_Document_20240117_143052.pdf'
         """
         # First, make the filename safe using werkzeug's secure_filename
+        # (kept on purpose: it also strips path parts, leading dots and
+        # Windows device names, which a simple character filter would miss)
         name = secure_filename(filename)
-        
+
         # Create timestamp string (Year-Month-Day_Hour-Minute-Second)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        # Split filename into name and extension
-        name_parts = name.rsplit('.', 1)
-        
-        if len(name_parts) == 2:
-            # If file has extension, add timestamp before extension
-            return f"{name_parts[0]}_{timestamp}.{name_parts[1]}"
-        
-        # If no extension, just add timestamp at the end
-        return f"{name}_{timestamp}"
+        # time.strftime formats the local time without a datetime object
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+
+        # Split filename into name and extension ('.pdf', or '' if none).
+        # secure_filename removes leading dots, so a name is never
+        # mistaken for a bare extension
+        base, extension = os.path.splitext(name)
+
+        # Add timestamp before the extension (or at the end if there is none)
+        return f"{base}_{timestamp}{extension}"
 
     # ========== Text Processing Methods ==========
 
@@ -99,13 +127,19 @@ class Helpers:
             >>> Helpers.clean_text('Hello    world!!! @#$')
             'Hello world!'
         """
-        # Remove extra whitespace (multiple spaces become single space)
-        text = re.sub(r'\s+', ' ', text)
-        
+        # Remove extra whitespace (multiple spaces become single space).
+        # split() breaks on the same whitespace characters as \s
+        text = ' '.join(text.split())
+
         # Remove special characters but keep basic punctuation
         # Keep: letters, numbers, spaces, periods, commas, question marks, exclamation marks
-        text = re.sub(r'[^\w\s\.\,\?\!]', '', text)
-        
+        if text.isascii():
+            # Fast path: a translation table instead of a regex
+            text = text.translate(_ASCII_SPECIAL_CHARS_TABLE)
+        else:
+            # Unicode letters and symbols need the regex's \w rules
+            text = _SPECIAL_CHARS_RE.sub('', text)
+
         # Remove leading and trailing whitespace
         return text.strip()
 
@@ -177,7 +211,9 @@ class Helpers:
 
         Example:
             >>> Helpers.generate_unique_id()
-            '20240117143052123456'
+            '1705498752123456789001a'
         """
-        # Create ID using: Year-Month-Day-Hour-Minute-Second-Microsecond
-        return datetime.now().strftime('%Y%m%d%H%M%S%f')
\ No newline at end of file
+        # Create ID using: nanoseconds since 1970 (19 digits) followed by a
+        # 4 hex digit counter, so IDs made at the same instant never collide.
+        # Much cheaper than building and formatting a datetime
+        return f"{time.time_ns():019d}{next(_ID_COUNTER) & 0xFFFF:04x}"
\ No newline at end of file